@@ -7,10 +7,49 @@ from datetime import datetime, timedelta
 from typing import Optional
 from fastapi import HTTPException, Request, status
 from fastapi_users.password import PasswordHelper
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import select
 from db import SessionLocal
 from models import User
 
+# Built once so the hashing context is only set up on import
+password_helper = PasswordHelper()
+
+# Dialect-specific INSERT constructs that support ON CONFLICT DO NOTHING
+_DIALECT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+
+def insert_superuser(session, is_staff: bool = False) -> bool:
+    """Insert the default superuser unless the email is taken; returns True if created"""
+    values = dict(
+        id=uuid.uuid4(),
+        email="admin@example.com",
+        hashed_password=password_helper.hash("admin123"),
+        is_active=True,
+        is_superuser=True,
+        is_staff=is_staff
+    )
+
+    dialect_insert = _DIALECT_INSERTS.get(session.get_bind().dialect.name)
+    if dialect_insert is None:
+        # Other backends: check first, then insert
+        existing = session.execute(select(User.id).where(User.email == values["email"])).first()
+        if existing:
+            return False
+        session.add(User(**values))
+        session.commit()
+        return True
+
+    # Insert unless the email is already taken, in a single statement
+    result = session.execute(
+        dialect_insert(User)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=["email"])
+    )
+    session.commit()
+    return result.rowcount > 0
+
 
 def create_user_token(user: User) -> str:
     """Create a JWT token for the user"""
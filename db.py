@@ -1,5 +1,6 @@
 # db.py - Simple database setup for base_assets
 import os
+import re
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
@@ -7,6 +8,9 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Matches the password segment of a database URL so it can be masked in logs
+_MASK_RE = re.compile(r':[^@]+@')
+
 # Get database URL from environment (defaults to SQLite for development)
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./test.db")
 
@@ -21,8 +25,7 @@ if "postgresql+asyncpg" in DATABASE_URL:
 print(f"🔍 Database URL: {DATABASE_URL}")
 if "postgresql" in DATABASE_URL:
     # Mask password in URL for logging
-    import re
-    masked_url = re.sub(r':[^@]+@', ':***@', DATABASE_URL)
+    masked_url = _MASK_RE.sub(':***@', DATABASE_URL)
     print(f"🔍 Masked URL: {masked_url}")
 
 # Create synchronous engine (psycopg2 for PostgreSQL)
@@ -1,7 +1,15 @@
 # =========================
 # main.py
 # =========================
+import asyncio
+import functools
+import itertools
+import mimetypes
 import os
+import shutil
+import uuid
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
 from starlette.middleware.base import BaseHTTPMiddleware
 
@@ -40,7 +48,12 @@ from sqlalchemy.orm import Session
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from dotenv import load_dotenv
+from sqlalchemy import text
+from sqlmodel import delete, insert, select
+from models import User, WebinarRegistrants
 from admin.setup import setup_admin
+from auth.core import insert_superuser, password_helper
+from services.webinar_service import get_s3_client
 from routes.chat import router as chat_router
 from routes.api import router as api_router
 try:
@@ -69,6 +82,121 @@ UPLOAD_DIR.mkdir(exist_ok=True)
 PHOTOS_DIR = UPLOAD_DIR / "photos"
 PHOTOS_DIR.mkdir(exist_ok=True)
 
+# Sample registrants for the CDN-based demo (built once at import time)
+_WEBINAR_DATE = datetime(2024, 3, 15, 14, 0, tzinfo=timezone.utc)
+_CDN_SAMPLE_REGISTRANTS: tuple[dict, ...] = (
+    {
+        "name": "Sarah Johnson",
+        "email": "sarah.johnson@techcorp.com",
+        "company": "TechCorp Solutions",
+        "webinar_title": "AI in Business: Practical Applications",
+        "webinar_date": _WEBINAR_DATE,
+        "status": "confirmed",
+        "notes": "Interested in AI implementation strategies",
+        "photo_url": "https://images.unsplash.com/photo-1507003211169-0a1dd7228f2d?w=200&h=200&fit=crop&crop=face"
+    },
+    {
+        "name": "Michael Chen",
+        "email": "michael.chen@innovate.com",
+        "company": "Innovate Labs",
+        "webinar_title": "AI in Business: Practical Applications",
+        "webinar_date": _WEBINAR_DATE,
+        "status": "confirmed",
+        "notes": "Looking for AI tools for data analysis",
+        "photo_url": "https://images.unsplash.com/photo-1494790108755-2616b612b786?w=200&h=200&fit=crop&crop=face"
+    },
+    {
+        "name": "Emily Rodriguez",
+        "email": "emily.rodriguez@startup.io",
+        "company": "StartupIO",
+        "webinar_title": "AI in Business: Practical Applications",
+        "webinar_date": _WEBINAR_DATE,
+        "status": "confirmed",
+        "notes": "Want to learn about AI automation",
+        "photo_url": "https://images.unsplash.com/photo-1472099645785-5658abf4ff4e?w=200&h=200&fit=crop&crop=face"
+    },
+    {
+        "name": "David Kim",
+        "email": "david.kim@enterprise.com",
+        "company": "Enterprise Systems",
+        "webinar_title": "AI in Business: Practical Applications",
+        "webinar_date": _WEBINAR_DATE,
+        "status": "confirmed",
+        "notes": "Exploring AI for customer service",
+        "photo_url": "https://images.unsplash.com/photo-1438761681033-6461ffad8d80?w=200&h=200&fit=crop&crop=face"
+    },
+)
+
+# Sample registrants for the photo-based seed endpoints, as (registrant data,
+# sample photo filename) pairs so handlers never mutate the shared dicts
+_SAMPLE_REGISTRANTS: tuple[tuple[dict, str], ...] = (
+    (
+        {
+            "name": "John Smith",
+            "email": "john.smith@example.com",
+            "company": "Tech Corp",
+            "webinar_title": "Advanced FastAPI Development",
+            "webinar_date": datetime(2024, 2, 15, 14, 0, tzinfo=timezone.utc),
+            "status": "registered",
+            "notes": ("Interested in implementing authentication systems. "
+                      "Has experience with Django and wants to migrate to FastAPI.")
+        },
+        "john_smith.jpg"
+    ),
+    (
+        {
+            "name": "Sarah Johnson",
+            "email": "sarah.johnson@startup.io",
+            "company": "Startup Inc",
+            "webinar_title": "Building Scalable APIs",
+            "webinar_date": datetime(2024, 2, 20, 10, 0, tzinfo=timezone.utc),
+            "status": "attended",
+            "notes": ("Startup founder looking to scale their API from 100 to 10,000 users. "
+                      "Currently using Express.js and considering FastAPI for better performance.")
+        },
+        "sarah_johnson.jpg"
+    ),
+    (
+        {
+            "name": "Michael Chen",
+            "email": "michael.chen@enterprise.com",
+            "company": "Enterprise Solutions",
+            "webinar_title": "Database Design Best Practices",
+            "webinar_date": datetime(2024, 2, 25, 16, 0, tzinfo=timezone.utc),
+            "status": "registered",
+            "notes": ("Senior architect evaluating database solutions for a new microservices project. "
+                      "Interested in PostgreSQL and Redis integration patterns.")
+        },
+        "michael_chen.jpg"
+    ),
+    (
+        {
+            "name": "Emily Davis",
+            "email": "emily.davis@freelance.dev",
+            "company": "Freelance Developer",
+            "webinar_title": "Modern Web Development",
+            "webinar_date": datetime(2024, 3, 1, 13, 0, tzinfo=timezone.utc),
+            "status": "registered",
+            "notes": ("Full-stack developer specializing in React and Node.js. "
+                      "Looking to expand skillset to include Python and FastAPI for backend development.")
+        },
+        "emily_davis.jpg"
+    ),
+    (
+        {
+            "name": "David Wilson",
+            "email": "david.wilson@consulting.co",
+            "company": "Tech Consulting",
+            "webinar_title": "API Security Fundamentals",
+            "webinar_date": datetime(2024, 3, 5, 15, 0, tzinfo=timezone.utc),
+            "status": "registered",
+            "notes": ("Security consultant working with financial services clients. "
+                      "Needs to implement OAuth2 and JWT token validation for compliance requirements.")
+        },
+        "david_wilson.jpg"
+    ),
+)
+
 # from users import fastapi_users, auth_backend  # type: ignore
 
 app = FastAPI()
@@ -412,10 +540,6 @@ async def change_password_submit(request: Request):
             )
         
         # Change password using the same logic as the CLI tool
-        from sqlmodel import select
-        from models import User
-        from fastapi_users.password import PasswordHelper
-        
         with SessionLocal() as session:
             # Find the user by email
             result = session.execute(select(User).where(User.email == email))
@@ -434,7 +558,6 @@ async def change_password_submit(request: Request):
                 )
             
             # Hash the new password
-            password_helper = PasswordHelper()
             hashed_password = password_helper.hash(new_password)
             
             # Update the user's password
@@ -457,43 +580,22 @@ async def change_password_submit(request: Request):
 def create_superuser():
     """Create a superuser account"""
     try:
-        from sqlmodel import select
-        from models import User
-        from fastapi_users.password import PasswordHelper
-        
         print("🔄 Creating superuser...")
         
         # Get the session factory from app state
         session_factory = app.state.session_factory
         
         with session_factory() as session:
-            password_helper = PasswordHelper()
-            password = "admin123"
-            hashed_pw = password_helper.hash(password)
-            
-            # Check if superuser already exists
-            result = session.execute(
-                select(User).where(User.email == "admin@example.com")
-            )
-            existing_user = result.scalar_one_or_none()
-            if existing_user:
-                print("⚠️  Superuser already exists: admin@example.com")
-                return {
-                    "status": "warning",
-                    "message": "Superuser already exists: admin@example.com",
-                    "email": "admin@example.com",
-                    "password": "admin123"
-                }
-                
-            user = User(
-                email="admin@example.com",
-                hashed_password=hashed_pw,
-                is_active=True,
-                is_superuser=True,
-                is_staff=True
-            )
-            session.add(user)
-            session.commit()
+            created = insert_superuser(session, is_staff=True)
+        
+        if not created:
+            print("⚠️  Superuser already exists: admin@example.com")
+            return {
+                "status": "warning",
+                "message": "Superuser already exists: admin@example.com",
+                "email": "admin@example.com",
+                "password": "admin123"
+            }
             
         print("✅ Superuser created: admin@example.com / admin123")
         return {
@@ -544,11 +646,6 @@ def init_database():
 def init_demo_async():
     """Initialize demo data using CDN-based images (no local file copying needed)"""
     try:
-        import uuid
-        from datetime import datetime, timezone
-        from models import WebinarRegistrants
-        from sqlmodel import select, delete
-        
         print("🚀 Starting demo initialization with CDN images...")
         
         # First, ensure database tables exist
@@ -627,112 +724,42 @@ def init_demo_async():
             }
         ]
         
-        products_created = 0
         with session_factory() as session:
             # Clear existing products
             session.execute(delete(Product))
             session.commit()
             
-            for product_data in sample_products:
-                product = Product(**product_data)
-                session.add(product)
-                products_created += 1
-            
+            # Queue every product at once so the flush batches the INSERTs
+            session.add_all([Product(**product_data) for product_data in sample_products])
             session.commit()
         
+        products_created = len(sample_products)
+        
         print(f"✅ Created {products_created} sample products")
         
         # Create superuser
         print("👤 Creating superuser...")
-        from sqlmodel import select
-        from models import User
-        from fastapi_users.password import PasswordHelper
-        
-        superuser_created = False
         with session_factory() as session:
-            password_helper = PasswordHelper()
-            password = "admin123"
-            hashed_pw = password_helper.hash(password)
-            
-            # Check if superuser already exists
-            result = session.execute(
-                select(User).where(User.email == "admin@example.com")
-            )
-            existing_user = result.scalar_one_or_none()
-            if not existing_user:
-                user = User(
-                    email="admin@example.com",
-                    hashed_password=hashed_pw,
-                    is_active=True,
-                    is_superuser=True,
-                    is_staff=True
-                )
-                session.add(user)
-                session.commit()
-                superuser_created = True
-                print("✅ Superuser created: admin@example.com / admin123")
-            else:
-                print("⚠️  Superuser already exists: admin@example.com")
+            superuser_created = insert_superuser(session, is_staff=True)
+        if superuser_created:
+            print("✅ Superuser created: admin@example.com / admin123")
+        else:
+            print("⚠️  Superuser already exists: admin@example.com")
         
         # No need to copy sample photos - using CDN URLs directly
         print("📸 Using CDN URLs for sample photos (no local file copying needed)")
         copied_count = 0
         
-        # Sample registrants data with CDN photo URLs (no local storage needed)
-        sample_registrants = [
-            {
-                "name": "Sarah Johnson",
-                "email": "sarah.johnson@techcorp.com",
-                "company": "TechCorp Solutions",
-                "webinar_title": "AI in Business: Practical Applications",
-                "webinar_date": datetime(2024, 3, 15, 14, 0, tzinfo=timezone.utc),
-                "status": "confirmed",
-                "notes": "Interested in AI implementation strategies",
-                "photo_url": "https://images.unsplash.com/photo-1507003211169-0a1dd7228f2d?w=200&h=200&fit=crop&crop=face"
-            },
-            {
-                "name": "Michael Chen",
-                "email": "michael.chen@innovate.com",
-                "company": "Innovate Labs",
-                "webinar_title": "AI in Business: Practical Applications", 
-                "webinar_date": datetime(2024, 3, 15, 14, 0, tzinfo=timezone.utc),
-                "status": "confirmed",
-                "notes": "Looking for AI tools for data analysis",
-                "photo_url": "https://images.unsplash.com/photo-1494790108755-2616b612b786?w=200&h=200&fit=crop&crop=face"
-            },
-            {
-                "name": "Emily Rodriguez",
-                "email": "emily.rodriguez@startup.io",
-                "company": "StartupIO",
-                "webinar_title": "AI in Business: Practical Applications",
-                "webinar_date": datetime(2024, 3, 15, 14, 0, tzinfo=timezone.utc),
-                "status": "confirmed", 
-                "notes": "Want to learn about AI automation",
-                "photo_url": "https://images.unsplash.com/photo-1472099645785-5658abf4ff4e?w=200&h=200&fit=crop&crop=face"
-            },
-            {
-                "name": "David Kim",
-                "email": "david.kim@enterprise.com",
-                "company": "Enterprise Systems",
-                "webinar_title": "AI in Business: Practical Applications",
-                "webinar_date": datetime(2024, 3, 15, 14, 0, tzinfo=timezone.utc),
-                "status": "confirmed",
-                "notes": "Exploring AI for customer service",
-                "photo_url": "https://images.unsplash.com/photo-1438761681033-6461ffad8d80?w=200&h=200&fit=crop&crop=face"
-            }
-        ]
-        
-        created_count = 0
-        
         with session_factory() as session:
             # Clear existing registrants
             session.execute(delete(WebinarRegistrants))
             session.commit()
             
-            for registrant_data in sample_registrants:
-                # Create new registrant with CDN URL
-                registrant = WebinarRegistrants(
-                    id=uuid.uuid4(),
+            # Create new registrants with CDN URLs; ids are generated client-side
+            # so the unit of work can batch all INSERTs into one flush
+            session.add_all([
+                WebinarRegistrants(
+                    id=registrant_id,
                     name=registrant_data['name'],
                     email=registrant_data['email'],
                     company=registrant_data['company'],
@@ -742,11 +769,13 @@ def init_demo_async():
                     notes=registrant_data['notes'],
                     photo_url=registrant_data['photo_url']  # Direct CDN URL
                 )
-                
-                session.add(registrant)
-                created_count += 1
-            
+                for registrant_id, registrant_data in zip(
+                    _new_uuids(len(_CDN_SAMPLE_REGISTRANTS)), _CDN_SAMPLE_REGISTRANTS
+                )
+            ])
             session.commit()
+        
+        created_count = len(_CDN_SAMPLE_REGISTRANTS)
 
         print("✅ Demo initialization complete!")
         return {
@@ -881,6 +910,14 @@ async def debug_simple():
     }
 
 
+def _peek_dir(path, limit: int) -> tuple[int, list[str]]:
+    """Count a directory's entries and return the first `limit` names in one scandir pass"""
+    with os.scandir(path) as entries:
+        names = [entry.name for entry in itertools.islice(entries, limit)]
+        count = len(names) + sum(1 for _ in entries)
+    return count, names
+
+
 @app.get("/debug/settings")
 async def debug_settings():
     """Debug endpoint to check current settings and upload directory configuration"""
@@ -892,36 +929,24 @@ async def debug_settings():
     photos_dir_exists = (upload_dir / "photos").exists()
     sample_photos_dir_exists = (upload_dir / "sample_photos").exists()
     
-    # Count files in photos directory
+    # Count files in photos directory and list some sample files
     photo_count = 0
-    if photos_dir_exists:
-        try:
-            photo_count = len(list((upload_dir / "photos").glob("*")))
-        except Exception:
-            photo_count = "error"
-    
-    # Count files in sample_photos directory
-    sample_photo_count = 0
-    if sample_photos_dir_exists:
-        try:
-            sample_photo_count = len(list((upload_dir / "sample_photos").glob("*")))
-        except Exception:
-            sample_photo_count = "error"
-    
-    # List some sample files
     sample_files = []
     if photos_dir_exists:
         try:
-            sample_files = [f.name for f in (upload_dir / "photos").glob("*")[:5]]
+            photo_count, sample_files = _peek_dir(upload_dir / "photos", 5)
         except Exception:
+            photo_count = "error"
             sample_files = ["error_reading_files"]
     
-    # List sample photos
+    # Count files in sample_photos directory and list sample photos
+    sample_photo_count = 0
     sample_photos_files = []
     if sample_photos_dir_exists:
         try:
-            sample_photos_files = [f.name for f in (upload_dir / "sample_photos").glob("*")[:5]]
+            sample_photo_count, sample_photos_files = _peek_dir(upload_dir / "sample_photos", 5)
         except Exception:
+            sample_photo_count = "error"
             sample_photos_files = ["error_reading_sample_photos"]
     
     return {
@@ -959,11 +984,11 @@ async def debug_list_files():
     photos_dir = upload_dir / "photos"
     if photos_dir.exists():
         try:
-            photos_files = list(photos_dir.glob("*"))
+            count, names = _peek_dir(photos_dir, 10)  # First 10 files
             files_info["photos"] = {
                 "exists": True,
-                "count": len(photos_files),
-                "files": [f.name for f in photos_files[:10]]  # First 10 files
+                "count": count,
+                "files": names
             }
         except Exception as e:
             files_info["photos"] = {"exists": True, "error": str(e)}
@@ -974,11 +999,11 @@ async def debug_list_files():
     sample_photos_dir = upload_dir / "sample_photos"
     if sample_photos_dir.exists():
         try:
-            sample_files = list(sample_photos_dir.glob("*"))
+            count, names = _peek_dir(sample_photos_dir, 10)
             files_info["sample_photos"] = {
                 "exists": True,
-                "count": len(sample_files),
-                "files": [f.name for f in sample_files[:10]]
+                "count": count,
+                "files": names
             }
         except Exception as e:
             files_info["sample_photos"] = {"exists": True, "error": str(e)}
@@ -991,24 +1016,59 @@ async def debug_list_files():
     }
 
 
+def _is_not_modified(request: Request, etag: str, mtime: float) -> bool:
+    """Check the conditional-GET headers against the file's validators"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence over If-Modified-Since
+        return if_none_match.strip() == "*" or etag in (
+            tag.strip() for tag in if_none_match.split(",")
+        )
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates are GMT; a "-0000" zone parses as naive, so don't read it as local time
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return int(mtime) <= since.timestamp()
+    return False
+
+
 @app.get("/debug/test-image/{filename}")
-async def debug_test_image(filename: str):
+async def debug_test_image(filename: str, request: Request):
     """Test if a specific image file can be served"""
     from pathlib import Path
-    from fastapi.responses import FileResponse
+    from fastapi.responses import FileResponse, Response
     
     upload_dir = Path(settings.upload_dir)
     photo_path = upload_dir / "photos" / filename
     
-    if photo_path.exists():
-        return FileResponse(photo_path)
-    else:
+    try:
+        stat_result = os.stat(photo_path)
+    except OSError:
         return {
             "error": "File not found",
             "expected_path": str(photo_path),
             "upload_dir": str(upload_dir),
             "filename": filename
         }
+    
+    etag = f'W/"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(stat_result.st_mtime, usegmt=True),
+        "Cache-Control": "public, max-age=3600"
+    }
+    
+    # Browser already has this version cached - skip reading the file
+    if _is_not_modified(request, etag, stat_result.st_mtime):
+        return Response(status_code=304, headers=headers)
+    
+    return FileResponse(photo_path, stat_result=stat_result, headers=headers)
 
 
 # Removed conflicting custom photo serving endpoint
@@ -1055,11 +1115,89 @@ def debug_connection():
         }
 
 
+# Chunk size used when streaming object bodies to disk
+_COPY_CHUNK_SIZE = 64 * 1024
+
+# Upper bound on concurrent Object Storage downloads during a restore; kept within
+# the shared client's connection pool so every in-flight request reuses a warm
+# keep-alive connection instead of paying a new TLS handshake
+_RESTORE_CONCURRENCY = 32
+
+
+def _s3():
+    """Shared S3 client for Object Storage (the same cached client the webinar service uses)"""
+    return get_s3_client(
+        settings.s3_access_key,
+        settings.s3_secret_key,
+        settings.s3_endpoint_url or "https://objstorage.leapcell.io",
+        settings.s3_region or "us-east-1"
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _content_type(suffix: str) -> str:
+    """Guess the content type for a file suffix such as ".jpg" (memoized per suffix)"""
+    return mimetypes.guess_type(f"file{suffix}")[0] or "application/octet-stream"
+
+
+def _list_backup_files(upload_dir: str) -> list[tuple[str, str]]:
+    """Collect (local path, S3 key) pairs for every file under the upload directory"""
+    files = []
+    for dirpath, _dirnames, filenames in os.walk(upload_dir):
+        # Build the key prefix once per directory, using "/" regardless of OS
+        rel_dir = os.path.relpath(dirpath, upload_dir)
+        prefix = "uploads/" if rel_dir == "." else f"uploads/{rel_dir.replace(os.sep, '/')}/"
+        for name in filenames:
+            files.append((os.path.join(dirpath, name), prefix + name))
+    return files
+
+
+def _put_file(s3, bucket: str, key: str, path: str) -> None:
+    """Upload a local file to Object Storage (blocking, run in a worker thread)"""
+    content_type = _content_type(os.path.splitext(path)[1].lower())
+    with open(path, "rb") as f:
+        s3.put_object(Bucket=bucket, Key=key, Body=f, ContentType=content_type)
+
+
+def _save_transient_body(body, path: Path, size: int | None = None) -> None:
+    """Write a one-shot S3 download to disk (blocking, run in a worker thread)
+
+    The extent is reserved up front when the size is known, and the pages are
+    released from the page cache afterwards since the app does not re-read them.
+    A download that fails part-way is removed rather than left zero-padded.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if size and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(fd, 0, size)
+            except OSError:
+                pass  # Not supported by every filesystem
+        written = 0
+        while chunk := body.read(_COPY_CHUNK_SIZE):
+            view = memoryview(chunk)
+            while view:
+                n = os.write(fd, view)
+                written += n
+                view = view[n:]
+        if size and written != size:
+            # Drop any preallocated tail the body did not fill
+            os.ftruncate(fd, written)
+        if hasattr(os, "posix_fadvise"):
+            # Only clean pages can be dropped, so flush the data first
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except BaseException:
+        os.close(fd)
+        path.unlink(missing_ok=True)
+        raise
+    os.close(fd)
+
+
 @app.post("/api/backup-files")
 async def backup_files():
     """Backup uploaded files to LeapCell Object Storage"""
     try:
-        import boto3
         from pathlib import Path
         
         # Check if S3 credentials are configured
@@ -1086,32 +1224,19 @@ async def backup_files():
         if not upload_dir.exists():
             return {"status": "error", "message": "Upload directory does not exist"}
         
-        # Initialize S3 client
-        s3 = boto3.client(
-            "s3",
-            region_name=os.getenv("S3_REGION", "us-east-1"),
-            endpoint_url=os.getenv("S3_ENDPOINT_URL", "https://objstorage.leapcell.io"),
-            aws_access_key_id=s3_access_key,
-            aws_secret_access_key=s3_secret_key
-        )
+        # Get the shared S3 client
+        s3 = _s3()
         
         files_backed_up = 0
         
+        # Walk the upload directory off the event loop
+        backup_files_list = await asyncio.to_thread(_list_backup_files, str(upload_dir))
+        
         # Backup all files in upload directory
-        for file_path in upload_dir.rglob("*"):
-            if file_path.is_file():
-                # Create S3 key (relative path from upload_dir)
-                relative_path = file_path.relative_to(upload_dir)
-                s3_key = f"uploads/{relative_path}"
-                
-                # Upload file to Object Storage
-                with open(file_path, "rb") as f:
-                    s3.put_object(
-                        Bucket=s3_bucket,
-                        Key=str(s3_key),
-                        Body=f
-                    )
-                files_backed_up += 1
+        for file_path, s3_key in backup_files_list:
+            # Upload file to Object Storage
+            await asyncio.to_thread(_put_file, s3, s3_bucket, s3_key, file_path)
+            files_backed_up += 1
         
         return {
             "status": "success",
@@ -1132,83 +1257,23 @@ async def backup_files():
 async def create_registrants_with_cdn():
     """Create registrants with CDN URLs directly - no file copying needed"""
     try:
-        import uuid
-        from datetime import datetime, timezone
-        from models import WebinarRegistrants
-        from sqlmodel import select, delete
-        
         # Get the session factory from app state
         session_factory = app.state.session_factory
         
-        # Sample registrants data with CDN URLs
-        sample_registrants = [
-            {
-                "name": "Sarah Johnson",
-                "email": "sarah.johnson@techcorp.com",
-                "company": "TechCorp Solutions",
-                "webinar_title": "AI in Business: Practical Applications",
-                "webinar_date": datetime(2024, 3, 15, 14, 0, tzinfo=timezone.utc),
-                "status": "confirmed",
-                "notes": "Interested in AI implementation strategies",
-                "photo_url": "https://images.unsplash.com/photo-1507003211169-0a1dd7228f2d?w=200&h=200&fit=crop&crop=face"
-            },
-            {
-                "name": "Michael Chen",
-                "email": "michael.chen@innovate.com",
-                "company": "Innovate Labs",
-                "webinar_title": "AI in Business: Practical Applications", 
-                "webinar_date": datetime(2024, 3, 15, 14, 0, tzinfo=timezone.utc),
-                "status": "confirmed",
-                "notes": "Looking for AI tools for data analysis",
-                "photo_url": "https://images.unsplash.com/photo-1494790108755-2616b612b786?w=200&h=200&fit=crop&crop=face"
-            },
-            {
-                "name": "Emily Rodriguez",
-                "email": "emily.rodriguez@startup.io",
-                "company": "StartupIO",
-                "webinar_title": "AI in Business: Practical Applications",
-                "webinar_date": datetime(2024, 3, 15, 14, 0, tzinfo=timezone.utc),
-                "status": "confirmed", 
-                "notes": "Want to learn about AI automation",
-                "photo_url": "https://images.unsplash.com/photo-1472099645785-5658abf4ff4e?w=200&h=200&fit=crop&crop=face"
-            },
-            {
-                "name": "David Kim",
-                "email": "david.kim@enterprise.com",
-                "company": "Enterprise Systems",
-                "webinar_title": "AI in Business: Practical Applications",
-                "webinar_date": datetime(2024, 3, 15, 14, 0, tzinfo=timezone.utc),
-                "status": "confirmed",
-                "notes": "Exploring AI for customer service",
-                "photo_url": "https://images.unsplash.com/photo-1438761681033-6461ffad8d80?w=200&h=200&fit=crop&crop=face"
-            }
+        rows = [
+            {"id": registrant_id, **registrant_data}
+            for registrant_id, registrant_data in zip(
+                _new_uuids(len(_CDN_SAMPLE_REGISTRANTS)), _CDN_SAMPLE_REGISTRANTS
+            )
         ]
         
-        created_count = 0
-        
         with session_factory() as session:
-            # Clear existing registrants
+            # Clear existing registrants and insert the new ones in one round-trip
             session.execute(delete(WebinarRegistrants))
+            session.execute(insert(WebinarRegistrants), rows)
             session.commit()
-            
-            for registrant_data in sample_registrants:
-                # Create new registrant with CDN URL
-                registrant = WebinarRegistrants(
-                    id=uuid.uuid4(),
-                    name=registrant_data['name'],
-                    email=registrant_data['email'],
-                    company=registrant_data['company'],
-                    webinar_title=registrant_data['webinar_title'],
-                    webinar_date=registrant_data['webinar_date'],
-                    status=registrant_data['status'],
-                    notes=registrant_data['notes'],
-                    photo_url=registrant_data['photo_url']  # Direct CDN URL
-                )
-                
-                session.add(registrant)
-                created_count += 1
-            
-            session.commit()
+        
+        created_count = len(rows)
         
         return {
             "status": "success",
@@ -1251,15 +1316,14 @@ async def download_from_cdn():
         for i, url in enumerate(cdn_urls, 1):
             try:
                 # Download from CDN
-                response = requests.get(url, timeout=10)
+                response = await asyncio.to_thread(requests.get, url, timeout=10)
                 response.raise_for_status()
                 
                 # Save to local directory
                 filename = f"sample_photo_{i}.jpg"
                 local_path = sample_photos_dir / filename
                 
-                with open(local_path, "wb") as f:
-                    f.write(response.content)
+                await asyncio.to_thread(local_path.write_bytes, response.content)
                 
                 downloaded_count += 1
                 print(f"Downloaded {filename} from CDN")
@@ -1289,26 +1353,18 @@ async def download_from_cdn():
 async def debug_bucket_mismatch():
     """Debug if there's a bucket mismatch between upload and download"""
     try:
-        import boto3
-        
         # Get settings
         settings = get_settings()
         
-        # Initialize S3 client
-        s3 = boto3.client(
-            "s3",
-            aws_access_key_id=settings.s3_access_key,
-            aws_secret_access_key=settings.s3_secret_key,
-            endpoint_url=settings.s3_endpoint_url,
-            region_name=settings.s3_region
-        )
+        # Get the shared S3 client
+        s3 = _s3()
         
         # Check what bucket we're using
         bucket_name = settings.s3_bucket
         
         # Try to list objects in this bucket
         try:
-            response = s3.list_objects_v2(Bucket=bucket_name)
+            response = await asyncio.to_thread(s3.list_objects_v2, Bucket=bucket_name)
             objects = response.get('Contents', [])
             
             return {
@@ -1338,7 +1394,6 @@ async def debug_bucket_mismatch():
 async def debug_exact_s3_keys():
     """Debug the exact S3 keys and try to download them"""
     try:
-        import boto3
         from pathlib import Path
         
         # Get upload directory
@@ -1346,17 +1401,11 @@ async def debug_exact_s3_keys():
         upload_dir = Path(settings.upload_dir)
         upload_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize S3 client
-        s3 = boto3.client(
-            "s3",
-            aws_access_key_id=settings.s3_access_key,
-            aws_secret_access_key=settings.s3_secret_key,
-            endpoint_url=settings.s3_endpoint_url,
-            region_name=settings.s3_region
-        )
+        # Get the shared S3 client
+        s3 = _s3()
         
         # List all objects
-        response = s3.list_objects_v2(Bucket=settings.s3_bucket)
+        response = await asyncio.to_thread(s3.list_objects_v2, Bucket=settings.s3_bucket)
         objects = response.get('Contents', [])
         
         results = []
@@ -1364,7 +1413,9 @@ async def debug_exact_s3_keys():
             s3_key = obj["Key"]
             try:
                 # Try to download this specific object
-                file_response = s3.get_object(Bucket=settings.s3_bucket, Key=s3_key)
+                file_response = await asyncio.to_thread(
+                    s3.get_object, Bucket=settings.s3_bucket, Key=s3_key
+                )
                 results.append({
                     "key": s3_key,
                     "size": obj["Size"],
@@ -1398,7 +1449,6 @@ async def debug_exact_s3_keys():
 async def test_restore_single():
     """Test restoring a single file to debug the issue"""
     try:
-        import boto3
         from pathlib import Path
         
         # Get upload directory
@@ -1406,30 +1456,29 @@ async def test_restore_single():
         upload_dir = Path(settings.upload_dir)
         upload_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize S3 client
-        s3 = boto3.client(
-            "s3",
-            aws_access_key_id=settings.s3_access_key,
-            aws_secret_access_key=settings.s3_secret_key,
-            endpoint_url=settings.s3_endpoint_url,
-            region_name=settings.s3_region
-        )
+        # Get the shared S3 client
+        s3 = _s3()
         
         # Try to download the first sample photo
-        s3_key = "photos%2Fsample_photo_1.jpg"
+        s3_key = "photos/sample_photo_1.jpg"
         
         try:
             # Download file from Object Storage
-            file_response = s3.get_object(Bucket=settings.s3_bucket, Key=s3_key)
+            file_response = await asyncio.to_thread(
+                s3.get_object, Bucket=settings.s3_bucket, Key=s3_key
+            )
             
             # Create local file path
-            relative_path = s3_key.replace("photos%2F", "photos/")
-            local_file_path = upload_dir / relative_path
+            local_file_path = upload_dir / s3_key
             local_file_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Save file locally
-            with open(local_file_path, "wb") as f:
-                f.write(file_response["Body"].read())
+            await asyncio.to_thread(
+                _save_transient_body,
+                file_response["Body"],
+                local_file_path,
+                file_response.get("ContentLength")
+            )
             
             return {
                 "status": "success",
@@ -1457,21 +1506,16 @@ async def test_restore_single():
 async def debug_s3_download(key: str):
     """Debug downloading a specific S3 object"""
     try:
-        import boto3
         from botocore.exceptions import ClientError
         
-        # Initialize S3 client
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id=settings.s3_access_key,
-            aws_secret_access_key=settings.s3_secret_key,
-            endpoint_url=settings.s3_endpoint_url,
-            region_name=settings.s3_region
-        )
+        # Get the shared S3 client
+        s3_client = _s3()
         
         try:
             # Try to get the object
-            response = s3_client.get_object(Bucket=settings.s3_bucket, Key=key)
+            response = await asyncio.to_thread(
+                s3_client.get_object, Bucket=settings.s3_bucket, Key=key
+            )
             return {
                 "status": "success",
                 "key": key,
@@ -1498,21 +1542,16 @@ async def debug_s3_download(key: str):
 async def debug_s3_objects():
     """Debug what objects are in the S3 bucket"""
     try:
-        import boto3
         from botocore.exceptions import ClientError
         
-        # Initialize S3 client
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id=settings.s3_access_key,
-            aws_secret_access_key=settings.s3_secret_key,
-            endpoint_url=settings.s3_endpoint_url,
-            region_name=settings.s3_region
-        )
+        # Get the shared S3 client
+        s3_client = _s3()
         
         # List all objects in the bucket
         try:
-            response = s3_client.list_objects_v2(Bucket=settings.s3_bucket)
+            response = await asyncio.to_thread(
+                s3_client.list_objects_v2, Bucket=settings.s3_bucket
+            )
             objects = response.get('Contents', [])
             
             return {
@@ -1547,7 +1586,6 @@ async def debug_s3_objects():
 async def debug_s3_connection():
     """Debug S3 connection and credentials"""
     try:
-        import boto3
         from botocore.exceptions import ClientError
         
         # Check S3 credentials
@@ -1560,18 +1598,14 @@ async def debug_s3_connection():
                 "s3_bucket": bool(settings.s3_bucket)
             }
 
-        # Initialize S3 client
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id=settings.s3_access_key,
-            aws_secret_access_key=settings.s3_secret_key,
-            endpoint_url=settings.s3_endpoint_url,
-            region_name=settings.s3_region
-        )
+        # Get the shared S3 client
+        s3_client = _s3()
         
         # Test S3 connection
         try:
-            response = s3_client.list_objects_v2(Bucket=settings.s3_bucket, MaxKeys=1)
+            response = await asyncio.to_thread(
+                s3_client.list_objects_v2, Bucket=settings.s3_bucket, MaxKeys=1
+            )
             return {
                 "status": "success",
                 "message": "S3 connection successful",
@@ -1601,7 +1635,6 @@ async def download_sample_photos_to_s3():
     try:
         import requests
         from pathlib import Path
-        import boto3
         from botocore.exceptions import ClientError
 
         # Check S3 credentials
@@ -1611,14 +1644,8 @@ async def download_sample_photos_to_s3():
                 "message": "S3 credentials not configured. Set S3_ACCESS_KEY, S3_SECRET_KEY, and S3_BUCKET environment variables."
             }
 
-        # Initialize S3 client
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id=settings.s3_access_key,
-            aws_secret_access_key=settings.s3_secret_key,
-            endpoint_url=settings.s3_endpoint_url,
-            region_name=settings.s3_region
-        )
+        # Get the shared S3 client
+        s3_client = _s3()
 
         # Sample photos from Unsplash
         sample_photos = [
@@ -1651,13 +1678,14 @@ async def download_sample_photos_to_s3():
             try:
                 # Download the image
                 print(f"Downloading {photo['url']}")
-                response = requests.get(photo["url"], timeout=10)
+                response = await asyncio.to_thread(requests.get, photo["url"], timeout=10)
                 response.raise_for_status()
                 print(f"Downloaded {photo['filename']}, size: {len(response.content)} bytes")
                 
                 # Upload directly to S3
                 s3_key = f"sample_photos/{photo['filename']}"
-                s3_client.put_object(
+                await asyncio.to_thread(
+                    s3_client.put_object,
                     Bucket=settings.s3_bucket,
                     Key=s3_key,
                     Body=response.content,
@@ -1732,11 +1760,10 @@ async def download_sample_photos():
                 continue
                 
             try:
-                response = requests.get(photo["url"], timeout=10)
+                response = await asyncio.to_thread(requests.get, photo["url"], timeout=10)
                 response.raise_for_status()
                 
-                with open(filename, "wb") as f:
-                    f.write(response.content)
+                await asyncio.to_thread(filename.write_bytes, response.content)
                 
                 downloaded_count += 1
                 
@@ -1829,6 +1856,30 @@ async def check_test_file():
         }
 
 
+def _snapshot_upload_dir(root: str) -> dict:
+    """List the upload directory in a single scandir pass (blocking, run in a worker thread)"""
+    directories = {}
+    all_files = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                try:
+                    count, names = _peek_dir(entry.path, 10)
+                    directories[entry.name] = {
+                        "exists": True,
+                        "count": count,
+                        "files": names
+                    }
+                except OSError as e:
+                    directories[entry.name] = {
+                        "exists": True,
+                        "error": str(e)
+                    }
+            elif entry.is_file(follow_symlinks=False):
+                all_files.append(entry.name)
+    return {"directories": directories, "all_files": all_files}
+
+
 @app.get("/api/debug-upload-dir")
 async def debug_upload_dir():
     """Debug what's actually in the upload directory"""
@@ -1842,59 +1893,122 @@ async def debug_upload_dir():
         "all_files": []
     }
     
-    if upload_dir.exists():
-        # List all directories
-        for item in upload_dir.iterdir():
-            if item.is_dir():
-                try:
-                    files = list(item.glob("*"))
-                    result["directories"][item.name] = {
-                        "exists": True,
-                        "count": len(files),
-                        "files": [f.name for f in files[:10]]
-                    }
-                except Exception as e:
-                    result["directories"][item.name] = {
-                        "exists": True,
-                        "error": str(e)
-                    }
-        
-        # List all files in root
+    if result["upload_dir_exists"]:
         try:
-            all_files = list(upload_dir.glob("*"))
-            result["all_files"] = [f.name for f in all_files if f.is_file()]
-        except Exception as e:
+            result.update(await asyncio.to_thread(_snapshot_upload_dir, str(upload_dir)))
+        except OSError as e:
             result["all_files"] = f"Error: {e}"
     
     return result
 
 
+def _link_or_copy(src, dst) -> None:
+    """Hardlink a read-only sample photo, falling back to a byte copy"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device link or filesystem without hardlink support
+        shutil.copyfile(src, dst)
+
+
+def _copy_all(jobs) -> None:
+    """Link or copy each (src, dst) pair (blocking, run in a worker thread)"""
+    for src, dst in jobs:
+        _link_or_copy(src, dst)
+
+
+def _copy_then_commit(jobs, commit) -> None:
+    """Copy all photos, then run the DB write; remove the copies if either step fails"""
+    try:
+        _copy_all(jobs)
+        commit()
+    except Exception:
+        # Don't leave orphan photos behind when the rows never land
+        for _, dst in jobs:
+            try:
+                os.unlink(dst)
+            except FileNotFoundError:
+                pass
+        raise
+
+
+def _replace_registrants(session_factory, rows) -> None:
+    """Clear all registrants and bulk insert rows in one transaction (blocking, run in a worker thread)"""
+    with session_factory() as session:
+        if session.get_bind().dialect.name == "postgresql":
+            # Throwaway demo data: don't wait on the WAL flush at commit
+            session.execute(text("SET LOCAL synchronous_commit = OFF"))
+            # Constant-time and reclaims storage immediately, unlike DELETE
+            session.execute(text(f"TRUNCATE {WebinarRegistrants.__tablename__}"))
+        else:
+            session.execute(delete(WebinarRegistrants))
+        if rows:
+            session.execute(insert(WebinarRegistrants), rows)
+        session.commit()
+
+
+def _new_uuids(n: int) -> list[uuid.UUID]:
+    """Build n random version-4 UUIDs from a single urandom read"""
+    raw = os.urandom(16 * n)
+    return [uuid.UUID(bytes=raw[i:i + 16], version=4) for i in range(0, len(raw), 16)]
+
+
+def _plan_sample_photos(upload_dir: Path) -> dict:
+    """Map each sample registrant's photo that exists to a (src, dst, photo_url) copy job"""
+    photos_dir = upload_dir / "photos"
+    photos_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        with os.scandir(upload_dir / "sample_photos") as entries:
+            available = {entry.name: entry for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        available = {}
+    
+    jobs = {}
+    prefixes = iter(_new_uuids(len(_SAMPLE_REGISTRANTS)))
+    for _, photo_filename in _SAMPLE_REGISTRANTS:
+        entry = available.get(photo_filename)
+        if entry is not None:
+            # Dashless hex prefix keeps filenames unique
+            unique_filename = f"{next(prefixes).hex}_{photo_filename}"
+            jobs[photo_filename] = (
+                entry,
+                photos_dir / unique_filename,
+                f"/static/uploads/photos/{unique_filename}"
+            )
+    return jobs
+
+
+def _copy_sample_dir(upload_dir: Path) -> list:
+    """Copy every sample .jpg into photos under a unique name (blocking, run in a worker thread)"""
+    photos_dir = upload_dir / "photos"
+    photos_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        with os.scandir(upload_dir / "sample_photos") as entries:
+            sample_files = [
+                entry for entry in entries if entry.name.endswith(".jpg") and entry.is_file()
+            ]
+    except FileNotFoundError:
+        sample_files = []
+    
+    # Same dashless hex prefix as _plan_sample_photos
+    jobs = [
+        (sample_file, photos_dir / f"{prefix.hex}_{sample_file.name}")
+        for sample_file, prefix in zip(sample_files, _new_uuids(len(sample_files)))
+    ]
+    _copy_all(jobs)
+    return jobs
+
+
 @app.post("/api/copy-sample-photos")
 async def copy_sample_photos():
     """Copy sample photos from sample_photos to photos directory"""
     try:
-        import shutil
-        import uuid
-        from pathlib import Path
+        # Scan and copy in one worker thread so the event loop stays free
+        jobs = await asyncio.to_thread(_copy_sample_dir, Path(settings.upload_dir))
+        copied_count = len(jobs)
         
-        upload_dir = Path(settings.upload_dir)
-        sample_photos_dir = upload_dir / "sample_photos"
-        photos_dir = upload_dir / "photos"
-        photos_dir.mkdir(parents=True, exist_ok=True)
-        
-        copied_count = 0
-        
-        if sample_photos_dir.exists():
-            for sample_file in sample_photos_dir.glob("*.jpg"):
-                # Generate unique filename
-                unique_filename = f"{uuid.uuid4()}_{sample_file.name}"
-                dest_path = photos_dir / unique_filename
-                
-                # Copy the file
-                shutil.copy2(sample_file, dest_path)
-                copied_count += 1
-                
-                print(f"Copied {sample_file.name} to {unique_filename}")
+        for sample_file, dest_path in jobs:
+            print(f"Copied {sample_file.name} to {dest_path.name}")
         
         return {
             "status": "success",
@@ -1914,120 +2028,32 @@ async def copy_sample_photos():
 async def clear_and_create_registrants():
     """Clear existing registrants and create fresh ones with photos"""
     try:
-        import uuid
-        import shutil
-        from pathlib import Path
-        from datetime import datetime, timezone
-        from models import WebinarRegistrants
-        from sqlmodel import select, delete
-        
         # Get the session factory from app state
         session_factory = app.state.session_factory
-        
-        # Sample registrants data
-        sample_registrants = [
-            {
-                "name": "John Smith",
-                "email": "john.smith@example.com",
-                "company": "Tech Corp",
-                "webinar_title": "Advanced FastAPI Development",
-                "webinar_date": datetime(2024, 2, 15, 14, 0, tzinfo=timezone.utc),
-                "status": "registered",
-                "photo_filename": "john_smith.jpg",
-                "notes": ("Interested in implementing authentication systems. "
-                          "Has experience with Django and wants to migrate to FastAPI.")
-            },
-            {
-                "name": "Sarah Johnson",
-                "email": "sarah.johnson@startup.io",
-                "company": "Startup Inc",
-                "webinar_title": "Building Scalable APIs",
-                "webinar_date": datetime(2024, 2, 20, 10, 0, tzinfo=timezone.utc),
-                "status": "attended",
-                "photo_filename": "sarah_johnson.jpg",
-                "notes": ("Startup founder looking to scale their API from 100 to 10,000 users. "
-                          "Currently using Express.js and considering FastAPI for better performance.")
-            },
-            {
-                "name": "Michael Chen",
-                "email": "michael.chen@enterprise.com",
-                "company": "Enterprise Solutions",
-                "webinar_title": "Database Design Best Practices",
-                "webinar_date": datetime(2024, 2, 25, 16, 0, tzinfo=timezone.utc),
-                "status": "registered",
-                "photo_filename": "michael_chen.jpg",
-                "notes": ("Senior architect evaluating database solutions for a new microservices project. "
-                          "Interested in PostgreSQL and Redis integration patterns.")
-            },
-            {
-                "name": "Emily Davis",
-                "email": "emily.davis@freelance.dev",
-                "company": "Freelance Developer",
-                "webinar_title": "Modern Web Development",
-                "webinar_date": datetime(2024, 3, 1, 13, 0, tzinfo=timezone.utc),
-                "status": "registered",
-                "photo_filename": "emily_davis.jpg",
-                "notes": ("Full-stack developer specializing in React and Node.js. "
-                          "Looking to expand skillset to include Python and FastAPI for backend development.")
-            },
-            {
-                "name": "David Wilson",
-                "email": "david.wilson@consulting.co",
-                "company": "Tech Consulting",
-                "webinar_title": "API Security Fundamentals",
-                "webinar_date": datetime(2024, 3, 5, 15, 0, tzinfo=timezone.utc),
-                "status": "registered",
-                "photo_filename": "david_wilson.jpg",
-                "notes": ("Security consultant working with financial services clients. "
-                          "Needs to implement OAuth2 and JWT token validation for compliance requirements.")
-            }
-        ]
-        
-        # Setup photo directories
         upload_dir = Path(settings.upload_dir)
-        sample_photos_dir = upload_dir / "sample_photos"
-        photos_dir = upload_dir / "photos"
-        photos_dir.mkdir(parents=True, exist_ok=True)
         
-        created_count = 0
-        
-        with session_factory() as session:
-            # Clear existing registrants
-            session.execute(delete(WebinarRegistrants))
-            session.commit()
-            
-            for registrant_data in sample_registrants:
-                # Copy sample photo if it exists
-                photo_url = None
-                photo_filename = registrant_data.pop('photo_filename')
-                sample_photo_path = sample_photos_dir / photo_filename
-                
-                if sample_photo_path.exists():
-                    # Generate unique filename for the photo
-                    unique_filename = f"{uuid.uuid4()}_{photo_filename}"
-                    photo_dest_path = photos_dir / unique_filename
-                    
-                    # Copy the sample photo
-                    shutil.copy2(sample_photo_path, photo_dest_path)
-                    photo_url = f"/static/uploads/photos/{unique_filename}"
-                
-                # Create new registrant
-                registrant = WebinarRegistrants(
-                    id=uuid.uuid4(),
-                    name=registrant_data['name'],
-                    email=registrant_data['email'],
-                    company=registrant_data['company'],
-                    webinar_title=registrant_data['webinar_title'],
-                    webinar_date=registrant_data['webinar_date'],
-                    status=registrant_data['status'],
-                    notes=registrant_data['notes'],
-                    photo_url=photo_url
-                )
-                
-                session.add(registrant)
-                created_count += 1
+        def reseed():
+            # Plan every photo copy up front so the row loop only looks up URLs
+            photo_jobs = _plan_sample_photos(upload_dir)
+            ids = _new_uuids(len(_SAMPLE_REGISTRANTS))
+            rows = []
+            for registrant_id, (registrant_data, photo_filename) in zip(ids, _SAMPLE_REGISTRANTS):
+                job = photo_jobs.get(photo_filename)
+                rows.append({
+                    "id": registrant_id,
+                    **registrant_data,
+                    "photo_url": job[2] if job else None
+                })
             
-            session.commit()
+            # Copy the sample photos, then clear existing registrants and bulk
+            # insert the new ones in a single transaction
+            _copy_then_commit(
+                [(src, dst) for src, dst, _ in photo_jobs.values()],
+                functools.partial(_replace_registrants, session_factory, rows)
+            )
+            return len(rows)
+        
+        created_count = await asyncio.to_thread(reseed)
         
         return {
             "status": "success",
@@ -2047,124 +2073,50 @@ async def clear_and_create_registrants():
 async def create_sample_registrants():
     """Create sample webinar registrants with photos"""
     try:
-        import asyncio
-        import uuid
-        import shutil
-        from pathlib import Path
-        from datetime import datetime, timezone
-        from models import WebinarRegistrants
-        from sqlmodel import select
-        
         # Get the session factory from app state
         session_factory = app.state.session_factory
-        
-        # Sample registrants data
-        sample_registrants = [
-            {
-                "name": "John Smith",
-                "email": "john.smith@example.com",
-                "company": "Tech Corp",
-                "webinar_title": "Advanced FastAPI Development",
-                "webinar_date": datetime(2024, 2, 15, 14, 0, tzinfo=timezone.utc),
-                "status": "registered",
-                "photo_filename": "john_smith.jpg",
-                "notes": ("Interested in implementing authentication systems. "
-                          "Has experience with Django and wants to migrate to FastAPI.")
-            },
-            {
-                "name": "Sarah Johnson",
-                "email": "sarah.johnson@startup.io",
-                "company": "Startup Inc",
-                "webinar_title": "Building Scalable APIs",
-                "webinar_date": datetime(2024, 2, 20, 10, 0, tzinfo=timezone.utc),
-                "status": "attended",
-                "photo_filename": "sarah_johnson.jpg",
-                "notes": ("Startup founder looking to scale their API from 100 to 10,000 users. "
-                          "Currently using Express.js and considering FastAPI for better performance.")
-            },
-            {
-                "name": "Michael Chen",
-                "email": "michael.chen@enterprise.com",
-                "company": "Enterprise Solutions",
-                "webinar_title": "Database Design Best Practices",
-                "webinar_date": datetime(2024, 2, 25, 16, 0, tzinfo=timezone.utc),
-                "status": "registered",
-                "photo_filename": "michael_chen.jpg",
-                "notes": ("Senior architect evaluating database solutions for a new microservices project. "
-                          "Interested in PostgreSQL and Redis integration patterns.")
-            },
-            {
-                "name": "Emily Davis",
-                "email": "emily.davis@freelance.dev",
-                "company": "Freelance Developer",
-                "webinar_title": "Modern Web Development",
-                "webinar_date": datetime(2024, 3, 1, 13, 0, tzinfo=timezone.utc),
-                "status": "registered",
-                "photo_filename": "emily_davis.jpg",
-                "notes": ("Full-stack developer specializing in React and Node.js. "
-                          "Looking to expand skillset to include Python and FastAPI for backend development.")
-            },
-            {
-                "name": "David Wilson",
-                "email": "david.wilson@consulting.co",
-                "company": "Tech Consulting",
-                "webinar_title": "API Security Fundamentals",
-                "webinar_date": datetime(2024, 3, 5, 15, 0, tzinfo=timezone.utc),
-                "status": "registered",
-                "photo_filename": "david_wilson.jpg",
-                "notes": ("Security consultant working with financial services clients. "
-                          "Needs to implement OAuth2 and JWT token validation for compliance requirements.")
-            }
-        ]
-        
-        # Setup photo directories
         upload_dir = Path(settings.upload_dir)
-        sample_photos_dir = upload_dir / "sample_photos"
-        photos_dir = upload_dir / "photos"
-        photos_dir.mkdir(parents=True, exist_ok=True)
-        
-        created_count = 0
         
-        with session_factory() as session:
-            for registrant_data in sample_registrants:
-                # Check if registrant already exists
-                existing = session.execute(
-                    select(WebinarRegistrants).where(WebinarRegistrants.email == registrant_data['email'])
-                )
-                if existing.scalar_one_or_none():
-                    continue
-                
-                # Copy sample photo if it exists
-                photo_url = None
-                photo_filename = registrant_data.pop('photo_filename')
-                sample_photo_path = sample_photos_dir / photo_filename
+        def seed():
+            # The lookup, photo copies and insert share one session so the
+            # whole unit of work is a single hop to a worker thread
+            photo_jobs = _plan_sample_photos(upload_dir)
+            ids = iter(_new_uuids(len(_SAMPLE_REGISTRANTS)))
+            rows = []
+            jobs = []
+            with session_factory() as session:
+                # Look up which sample emails already exist in a single query
+                existing_emails = set(session.execute(
+                    select(WebinarRegistrants.email).where(
+                        WebinarRegistrants.email.in_([r['email'] for r, _ in _SAMPLE_REGISTRANTS])
+                    )
+                ).scalars())
                 
-                if sample_photo_path.exists():
-                    # Generate unique filename for the photo
-                    unique_filename = f"{uuid.uuid4()}_{photo_filename}"
-                    photo_dest_path = photos_dir / unique_filename
+                for registrant_data, photo_filename in _SAMPLE_REGISTRANTS:
+                    # Skip registrants that already exist
+                    if registrant_data['email'] in existing_emails:
+                        continue
                     
-                    # Copy the sample photo
-                    shutil.copy2(sample_photo_path, photo_dest_path)
-                    photo_url = f"/static/uploads/photos/{unique_filename}"
+                    job = photo_jobs.get(photo_filename)
+                    if job:
+                        jobs.append(job[:2])
+                    
+                    rows.append({
+                        "id": next(ids),
+                        **registrant_data,
+                        "photo_url": job[2] if job else None
+                    })
                 
-                # Create new registrant
-                registrant = WebinarRegistrants(
-                    id=uuid.uuid4(),
-                    name=registrant_data['name'],
-                    email=registrant_data['email'],
-                    company=registrant_data['company'],
-                    webinar_title=registrant_data['webinar_title'],
-                    webinar_date=registrant_data['webinar_date'],
-                    status=registrant_data['status'],
-                    notes=registrant_data['notes'],
-                    photo_url=photo_url
-                )
+                def commit():
+                    session.execute(insert(WebinarRegistrants), rows)
+                    session.commit()
                 
-                session.add(registrant)
-                created_count += 1
-            
-            session.commit()
+                # Copy the photos and insert all new registrants in one statement
+                if rows:
+                    _copy_then_commit(jobs, commit)
+            return len(rows)
+        
+        created_count = await asyncio.to_thread(seed)
         
         return {
             "status": "success",
@@ -2180,13 +2132,23 @@ async def create_sample_registrants():
         }
 
 
+def _download_object(s3, bucket: str, s3_key: str, upload_dir: Path) -> None:
+    """Download one object into the upload directory (blocking, run in a worker thread)"""
+    file_response = s3.get_object(Bucket=bucket, Key=s3_key)
+    
+    # Create local file path
+    local_file_path = upload_dir / s3_key
+    local_file_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Stream the body to disk so the whole file never sits in memory
+    with open(local_file_path, "wb") as f:
+        shutil.copyfileobj(file_response["Body"], f, _COPY_CHUNK_SIZE)
+
+
 @app.post("/api/restore-files")
 async def restore_files():
     """Restore uploaded files from LeapCell Object Storage"""
     try:
-        import boto3
-        from pathlib import Path
-        
         # Check if S3 credentials are configured
         s3_access_key = os.getenv("S3_ACCESS_KEY")
         s3_secret_key = os.getenv("S3_SECRET_KEY")
@@ -2209,45 +2171,58 @@ async def restore_files():
         upload_dir = Path(settings.upload_dir)
         upload_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize S3 client
-        s3 = boto3.client(
-            "s3",
-            region_name=os.getenv("S3_REGION", "us-east-1"),
-            endpoint_url=os.getenv("S3_ENDPOINT_URL", "https://objstorage.leapcell.io"),
-            aws_access_key_id=s3_access_key,
-            aws_secret_access_key=s3_secret_key
-        )
-        
-        files_restored = 0
-        
-        # List objects in Object Storage
-        response = s3.list_objects_v2(
-            Bucket=s3_bucket
-        )
+        # Get the shared S3 client (its warm connection pool is reused across requests)
+        s3 = _s3()
+        
+        # Download files concurrently, capped to the connection pool size
+        semaphore = asyncio.Semaphore(_RESTORE_CONCURRENCY)
+        
+        async def download(s3_key: str) -> None:
+            async with semaphore:
+                await asyncio.to_thread(_download_object, s3, s3_bucket, s3_key, upload_dir)
+        
+        # List only objects under photos/ (server-side prefix filter), paging
+        # past the 1000-key limit; downloads start while the next page is listed
+        paginator = s3.get_paginator("list_objects_v2")
+        pages = iter(paginator.paginate(
+            Bucket=s3_bucket,
+            Prefix="photos/",
+            PaginationConfig={"PageSize": 1000}
+        ))
+        keys = []
+        downloads = []
+        try:
+            while (page := await asyncio.to_thread(next, pages, None)) is not None:
+                for obj in page.get("Contents", []):
+                    if obj["Key"].endswith("/"):
+                        continue  # Skip directories
+                    keys.append(obj["Key"])
+                    downloads.append(asyncio.create_task(download(obj["Key"])))
+        except BaseException:
+            # Listing failed: don't leave downloads writing after we respond
+            for task in downloads:
+                task.cancel()
+            await asyncio.gather(*downloads, return_exceptions=True)
+            raise
+        
+        # Wait for every download and report per-key failures
+        results = await asyncio.gather(*downloads, return_exceptions=True)
+        failed = [
+            {"key": key, "error": str(result)}
+            for key, result in zip(keys, results)
+            if isinstance(result, BaseException)
+        ]
+        for item in failed:
+            print(f"❌ Failed to restore {item['key']}: {item['error']}")
+        files_restored = len(keys) - len(failed)
         
-        for obj in response.get("Contents", []):
-            s3_key = obj["Key"]
-            if s3_key.endswith("/"):
-                continue  # Skip directories
-            
-            # Only process photos files
-            if not s3_key.startswith("photos"):
-                continue
-            
-            # Download file from Object Storage
-            file_response = s3.get_object(Bucket=s3_bucket, Key=s3_key)
-            
-            # Create local file path
-            # Convert URL-encoded key to normal path
-            relative_path = s3_key.replace("photos%2F", "photos/")
-            local_file_path = upload_dir / relative_path
-            local_file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Save file locally
-            with open(local_file_path, "wb") as f:
-                f.write(file_response["Body"].read())
-            
-            files_restored += 1
+        if failed:
+            return {
+                "status": "warning",
+                "message": f"Restored {files_restored} files from Object Storage, {len(failed)} failed",
+                "files_count": files_restored,
+                "failed": failed
+            }
         
         return {
             "status": "success",
@@ -1,11 +1,13 @@
 """
 API routes for data endpoints
 """
-from fastapi import APIRouter, Depends, Request
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import JSONResponse
 from models import User
 from dependencies.auth import get_current_staff_or_admin
 from dependencies.services import get_product_service
+from services.webinar_service import DEFAULT_PAGE_SIZE
 
 router = APIRouter()
 
@@ -18,21 +20,44 @@ async def get_products(product_service = Depends(get_product_service)):
 
 
 @router.get("/registrants")
-async def get_registrants(current_user: User = Depends(get_current_staff_or_admin)):
-    """Get all webinar registrants with their photos"""
+async def get_registrants(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=500),
+    after: Optional[str] = None,
+    current_user: User = Depends(get_current_staff_or_admin)
+):
+    """Get a page of webinar registrants with their photos (pass next_cursor as `after`)"""
     from services.webinar_service import WebinarService
     
-    registrants = WebinarService.get_all_registrants()
-    return JSONResponse({"registrants": registrants})
+    try:
+        registrants, next_cursor = await WebinarService.get_all_registrants(limit, after)
+    except ValueError:
+        return JSONResponse({"error": "Invalid cursor"}, status_code=400)
+    return JSONResponse({"registrants": registrants, "next_cursor": next_cursor})
+
+
+@router.get("/webinar-attendees/count")
+async def get_webinar_attendee_counts():
+    """Get the total number of attendees and distinct webinars for the demo page counters"""
+    from services.webinar_service import WebinarService
+    
+    attendees, webinars = await WebinarService.get_registrant_counts()
+    return JSONResponse({"attendees": attendees, "webinars": webinars})
 
 
 @router.get("/webinar-attendees")
-async def get_webinar_attendees(request: Request):
-    """Get webinar attendees for the marketing demo page"""
+async def get_webinar_attendees(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=500),
+    after: Optional[str] = None
+):
+    """Get a page of webinar attendees for the marketing demo page (pass next_cursor as `after`)"""
     from services.webinar_service import WebinarService
     from fastapi.templating import Jinja2Templates
     
-    attendees = WebinarService.get_webinar_attendees()
+    try:
+        attendees, next_cursor = await WebinarService.get_webinar_attendees(limit, after)
+    except ValueError:
+        return JSONResponse({"error": "Invalid cursor"}, status_code=400)
     
     # Check if this is an HTMX request
     templates = Jinja2Templates(directory="templates")
@@ -41,7 +66,9 @@ async def get_webinar_attendees(request: Request):
     if 'hx-request' in request.headers:
         return templates.TemplateResponse("partials/attendees-grid.html", {
             "request": request,
-            "attendees": attendees
+            "attendees": attendees,
+            "after": after,
+            "next_cursor": next_cursor
         })
     else:
-        return JSONResponse({"attendees": attendees}) 
\ No newline at end of file
+        return JSONResponse({"attendees": attendees, "next_cursor": next_cursor}) 
\ No newline at end of file
@@ -33,10 +33,13 @@ async def database_demo(request: Request):
 @router.get("/webinar-registrants", response_class=HTMLResponse)
 async def webinar_registrants(request: Request, current_user: User = Depends(get_current_staff_or_admin)):
     """Webinar registrants management page"""
+    from services.webinar_service import WebinarService
+    
     return templates.TemplateResponse("webinar-registrants.html", {
         "request": request,
         "title": "Webinar Registrants",
-        "current_page": "webinar-registrants"
+        "current_page": "webinar-registrants",
+        "direct_upload": WebinarService.direct_upload_enabled()
     })
 
 
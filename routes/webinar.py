@@ -2,8 +2,9 @@
 Webinar registrant management routes
 """
 from typing import Optional
-from fastapi import APIRouter, Depends, UploadFile, File, Form
-from fastapi.responses import HTMLResponse
+from uuid import UUID
+from fastapi import APIRouter, BackgroundTasks, Depends, UploadFile, File, Form
+from fastapi.responses import HTMLResponse, JSONResponse
 from models import User
 from dependencies.auth import get_current_staff_or_admin
 
@@ -12,7 +13,7 @@ router = APIRouter()
 
 @router.post("/upload-photo/{registrant_id}")
 async def upload_photo(
-    registrant_id: str,
+    registrant_id: UUID,
     photo: UploadFile = File(...),
     description: Optional[str] = Form(None),
     current_user: User = Depends(get_current_staff_or_admin)
@@ -35,13 +36,10 @@ async def upload_photo(
             status_code=400
         )
     
-    # Read file content
-    content = await photo.read()
-    
-    # Use service to handle upload
+    # Use service to handle upload, streaming straight from the spooled upload file
     from services.webinar_service import WebinarService
-    success, message, _ = WebinarService.upload_photo(
-        registrant_id, content, photo.filename or "photo.jpg"
+    success, message, _ = await WebinarService.upload_photo(
+        registrant_id, photo.file, photo.filename or "photo.jpg", photo.content_type
     )
     
     if success:
@@ -57,15 +55,55 @@ async def upload_photo(
         )
 
 
+@router.post("/presigned-upload/{registrant_id}")
+async def create_presigned_upload(
+    registrant_id: UUID,
+    filename: str = Form("photo.jpg"),
+    current_user: User = Depends(get_current_staff_or_admin)
+):
+    """Create a presigned POST so the browser uploads a photo directly to Object Storage"""
+    from services.webinar_service import WebinarService
+    
+    success, message, upload = await WebinarService.create_presigned_upload(registrant_id, filename)
+    
+    if success:
+        return upload
+    return JSONResponse({"error": message}, status_code=400)
+
+
+@router.post("/confirm-photo/{registrant_id}")
+async def confirm_photo(
+    registrant_id: UUID,
+    key: str = Form(...),
+    current_user: User = Depends(get_current_staff_or_admin)
+):
+    """Attach a photo uploaded through a presigned POST to a webinar registrant"""
+    from services.webinar_service import WebinarService
+    
+    success, message, _ = await WebinarService.confirm_photo(registrant_id, key)
+    
+    if success:
+        return HTMLResponse(
+            '<div class="bg-green-100 border border-green-400 text-green-700 px-4 py-3 rounded">'
+            f'{message}</div>'
+        )
+    else:
+        return HTMLResponse(
+            f'<div class="bg-red-100 border border-red-400 text-red-700 px-4 py-3 rounded">'
+            f'Error: {message}</div>',
+            status_code=400
+        )
+
+
 @router.post("/update-notes/{registrant_id}")
 async def update_notes(
-    registrant_id: str,
+    registrant_id: UUID,
     notes: str = Form(...)
 ):
     """Update notes for a webinar registrant"""
     from services.webinar_service import WebinarService
     
-    success, message = WebinarService.update_notes(registrant_id, notes)
+    success, message = await WebinarService.update_notes(registrant_id, notes)
     
     if success:
         return HTMLResponse(
@@ -81,11 +119,15 @@ async def update_notes(
 
 
 @router.delete("/delete-photo/{registrant_id}")
-async def delete_photo(registrant_id: str):
+async def delete_photo(registrant_id: UUID, background_tasks: BackgroundTasks):
     """Delete a photo for a webinar registrant"""
     from services.webinar_service import WebinarService
     
-    success, message = WebinarService.delete_photo(registrant_id)
+    success, message, photo_path = await WebinarService.delete_photo(registrant_id)
+    
+    # Remove the local file after the response is sent
+    if photo_path:
+        background_tasks.add_task(WebinarService.remove_photo_file, photo_path)
     
     if success:
         return HTMLResponse(
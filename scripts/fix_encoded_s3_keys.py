@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+One-shot migration: rename Object Storage keys that contain a URL-encoded slash ("%2F")
+so they use literal slashes. Objects whose target key already exists are skipped.
+"""
+
+import os
+from botocore.exceptions import ClientError
+from services.webinar_service import get_s3_client
+
+
+def _key_exists(s3, bucket: str, key: str) -> bool:
+    """Return True if an object with this key is already in the bucket"""
+    try:
+        s3.head_object(Bucket=bucket, Key=key)
+        return True
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            return False
+        raise
+
+
+def fix_encoded_keys(s3, bucket: str) -> tuple[list[dict], list[dict]]:
+    """Rename objects whose keys contain "%2F"; returns (renamed, skipped)"""
+    renamed = []
+    skipped = []
+    paginator = s3.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket):
+        for obj in page.get("Contents", []):
+            old_key = obj["Key"]
+            if "%2F" not in old_key and "%2f" not in old_key:
+                continue
+            new_key = old_key.replace("%2F", "/").replace("%2f", "/")
+
+            # Never overwrite an object that already uses the target key
+            if _key_exists(s3, bucket, new_key):
+                skipped.append({"old_key": old_key, "new_key": new_key})
+                continue
+
+            s3.copy_object(
+                Bucket=bucket,
+                Key=new_key,
+                CopySource={"Bucket": bucket, "Key": old_key}
+            )
+            s3.delete_object(Bucket=bucket, Key=old_key)
+            renamed.append({"old_key": old_key, "new_key": new_key})
+    return renamed, skipped
+
+
+def main():
+    s3_access_key = os.getenv("S3_ACCESS_KEY")
+    s3_secret_key = os.getenv("S3_SECRET_KEY")
+    s3_bucket = os.getenv("S3_BUCKET")
+
+    if not all([s3_access_key, s3_secret_key, s3_bucket]):
+        print("❌ S3 credentials not configured. Set S3_ACCESS_KEY, S3_SECRET_KEY, and S3_BUCKET environment variables.")
+        return
+
+    s3 = get_s3_client(
+        s3_access_key,
+        s3_secret_key,
+        os.getenv("S3_ENDPOINT_URL", "https://objstorage.leapcell.io"),
+        os.getenv("S3_REGION", "us-east-1")
+    )
+
+    renamed, skipped = fix_encoded_keys(s3, s3_bucket)
+
+    for item in renamed:
+        print(f"✅ Renamed {item['old_key']} -> {item['new_key']}")
+    for item in skipped:
+        print(f"⚠️  Skipped {item['old_key']}: {item['new_key']} already exists")
+
+    print(f"\n🎉 Renamed {len(renamed)} objects with URL-encoded keys, skipped {len(skipped)}")
+
+if __name__ == "__main__":
+    main()
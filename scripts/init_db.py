@@ -2,13 +2,15 @@
 # init_db.py - Database initialization script
 # =========================
 from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
 from db import DATABASE_URL
 from sqlmodel import SQLModel
 
 
 def init_db():
     """Initialize the database by creating all tables."""
-    engine = create_engine(DATABASE_URL, echo=True)
+    # One-shot engine: a single connection, no pool to set up or tear down
+    engine = create_engine(DATABASE_URL, echo=True, poolclass=NullPool)
 
     with engine.begin() as conn:
         # Create all tables
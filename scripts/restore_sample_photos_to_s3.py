@@ -4,19 +4,66 @@ Script to restore sample photos to Object Storage for production
 """
 
 import asyncio
-import boto3
 import os
 from pathlib import Path
+from boto3.s3.transfer import TransferConfig
+from services.webinar_service import get_s3_client
 
-async def restore_sample_photos_to_s3():
-    """Restore sample photos from local static/uploads/sample_photos to Object Storage"""
-    
-    # Check S3 credentials
+# Maximum number of uploads in flight at once (below the shared client's pool size)
+UPLOAD_CONCURRENCY = 16
+
+# Stream files from disk and switch to parallel multipart uploads above 8 MB
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True
+)
+
+
+def upload_photo(s3, s3_bucket: str, photo_file: os.DirEntry) -> str:
+    """Upload a single photo to Object Storage and return its key"""
+    s3_key = f"uploads/photos/{photo_file.name}"
+    with open(photo_file, "rb") as f:
+        s3.upload_fileobj(
+            f,
+            s3_bucket,
+            s3_key,
+            ExtraArgs={"ContentType": "image/jpeg"},
+            Config=TRANSFER_CONFIG
+        )
+    return s3_key
+
+
+def create_s3_client():
+    """Create an S3 client from environment variables, or None if credentials are missing"""
     s3_access_key = os.getenv("S3_ACCESS_KEY")
     s3_secret_key = os.getenv("S3_SECRET_KEY")
-    s3_bucket = os.getenv("S3_BUCKET")
     
     if not s3_access_key or not s3_secret_key:
+        return None
+    
+    return get_s3_client(
+        s3_access_key,
+        s3_secret_key,
+        os.getenv("S3_ENDPOINT_URL", "https://objstorage.leapcell.io"),
+        os.getenv("S3_REGION", "us-east-1")
+    )
+
+
+async def restore_sample_photos_to_s3(s3=None):
+    """Restore sample photos from local static/uploads/sample_photos to Object Storage
+    
+    Pass an existing S3 client to reuse its connection pool; otherwise one is
+    created from the S3_* environment variables.
+    """
+    
+    # Check S3 credentials
+    s3_bucket = os.getenv("S3_BUCKET")
+    
+    if s3 is None:
+        s3 = create_s3_client()
+    
+    if s3 is None:
         print("❌ S3 credentials not configured. Set S3_ACCESS_KEY and S3_SECRET_KEY environment variables.")
         return
     
@@ -24,15 +71,6 @@ async def restore_sample_photos_to_s3():
         print("❌ S3 bucket not configured. Set S3_BUCKET environment variable.")
         return
     
-    # Initialize S3 client
-    s3 = boto3.client(
-        "s3",
-        region_name=os.getenv("S3_REGION", "us-east-1"),
-        endpoint_url=os.getenv("S3_ENDPOINT_URL", "https://objstorage.leapcell.io"),
-        aws_access_key_id=s3_access_key,
-        aws_secret_access_key=s3_secret_key
-    )
-    
     # Find sample photos
     sample_photos_dir = Path("static/uploads/sample_photos")
     if not sample_photos_dir.exists():
@@ -41,27 +79,30 @@ async def restore_sample_photos_to_s3():
     
     print(f"📸 Found sample photos directory: {sample_photos_dir}")
     
-    # Upload each sample photo
+    # Upload all sample photos concurrently, capped to the connection pool size
+    with os.scandir(sample_photos_dir) as entries:
+        photo_files = sorted(
+            (entry for entry in entries if entry.name.endswith(".jpg") and entry.is_file()),
+            key=lambda entry: entry.name
+        )
+    semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+    
+    async def upload_one(photo_file: os.DirEntry) -> str:
+        async with semaphore:
+            return await asyncio.to_thread(upload_photo, s3, s3_bucket, photo_file)
+    
+    results = await asyncio.gather(
+        *(upload_one(photo_file) for photo_file in photo_files),
+        return_exceptions=True
+    )
+    
     uploaded_count = 0
-    for photo_file in sample_photos_dir.glob("*.jpg"):
-        try:
-            # Create S3 key
-            s3_key = f"uploads/photos/{photo_file.name}"
-            
-            # Upload to S3
-            with open(photo_file, "rb") as f:
-                s3.put_object(
-                    Bucket=s3_bucket,
-                    Key=s3_key,
-                    Body=f,
-                    ContentType="image/jpeg"
-                )
-            
-            print(f"✅ Uploaded {photo_file.name} to {s3_key}")
+    for photo_file, result in zip(photo_files, results):
+        if isinstance(result, Exception):
+            print(f"❌ Failed to upload {photo_file.name}: {result}")
+        else:
+            print(f"✅ Uploaded {photo_file.name} to {result}")
             uploaded_count += 1
-            
-        except Exception as e:
-            print(f"❌ Failed to upload {photo_file.name}: {e}")
     
     print(f"\n🎉 Successfully uploaded {uploaded_count} sample photos to Object Storage")
     print("💡 These photos will now be available via the /static/uploads/photos/ endpoint")
@@ -1,71 +1,291 @@
 """
 Webinar service for handling webinar registrant business logic
 """
+import asyncio
+import mimetypes
 import os
+import shutil
+import threading
+from datetime import datetime
+from functools import lru_cache
+from operator import methodcaller
 from pathlib import Path
-from typing import Optional
+from secrets import token_hex
+from types import SimpleNamespace
+from typing import BinaryIO, Optional
 from uuid import UUID
-import uuid
-from sqlmodel import select
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from sqlalchemy import distinct, func, tuple_
+from sqlmodel import select, update
 from db import SessionLocal
 from models import WebinarRegistrants
 
 
+# Shared by every cached client (uploads here, backup/restore and debug in main.py)
+# so its urllib3 pool keeps connections warm; the pool covers main.py's 32 concurrent
+# restore downloads, and the short connect timeout makes a stalled endpoint fail fast
+# instead of pinning a worker thread
+_S3_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=30,
+    retries={"max_attempts": 5, "mode": "adaptive"}
+)
+
+# One boto3 session for all clients, so endpoint/credential resolution is loaded once.
+# Sessions are not thread-safe, so client creation is serialised.
+_S3_SESSION = boto3.session.Session()
+_S3_SESSION_LOCK = threading.Lock()
+
+# Photos above 8 MB go up as parallel multipart parts
+_TRANSFER_CFG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
+)
+
+# Local static files root; photo URLs under /static/ map onto it
+_STATIC_ROOT = Path("static")
+
+# Upper bound enforced on direct-to-storage uploads (matches the form upload limit)
+_MAX_PHOTO_BYTES = 5 * 1024 * 1024
+
+# How long a presigned upload form stays valid, in seconds
+_PRESIGNED_EXPIRY = 300
+
+# Column projections for the registrant list views (only what each view renders)
+_REGISTRANT_COLS = (
+    WebinarRegistrants.id,
+    WebinarRegistrants.name,
+    WebinarRegistrants.email,
+    WebinarRegistrants.company,
+    WebinarRegistrants.webinar_title,
+    WebinarRegistrants.webinar_date,
+    WebinarRegistrants.status,
+    WebinarRegistrants.photo_url,
+    WebinarRegistrants.notes,
+    WebinarRegistrants.registration_date,
+)
+_ATTENDEE_COLS = (
+    WebinarRegistrants.id,
+    WebinarRegistrants.name,
+    WebinarRegistrants.email,
+    WebinarRegistrants.company,
+    WebinarRegistrants.webinar_title,
+    WebinarRegistrants.webinar_date,
+    WebinarRegistrants.status,
+    WebinarRegistrants.group,
+    WebinarRegistrants.notes,
+    WebinarRegistrants.photo_url,
+    WebinarRegistrants.created_at,
+)
+
+# JSON conversions applied per column; anything else is passed through as-is
+_isoformat = methodcaller("isoformat")
+_COLUMN_CONVERTERS = {
+    "id": str,
+    "webinar_date": _isoformat,
+    "registration_date": _isoformat,
+    "created_at": _isoformat,
+}
+
+
+def _projection(columns):
+    """Return (keys, [(position, converter), ...]) for a column tuple, skipping pass-through columns"""
+    keys = tuple(column.key for column in columns)
+    converters = tuple(
+        (position, _COLUMN_CONVERTERS[key])
+        for position, key in enumerate(keys)
+        if key in _COLUMN_CONVERTERS
+    )
+    return keys, converters
+
+
+# List queries are built once at import, newest first by (sort column, id),
+# together with the key/converter projection for their columns
+_REGISTRANT_LIST_STMT = select(*_REGISTRANT_COLS).order_by(
+    WebinarRegistrants.registration_date.desc(), WebinarRegistrants.id.desc()
+)
+_REGISTRANT_PROJECTION = _projection(_REGISTRANT_COLS)
+_ATTENDEE_LIST_STMT = select(*_ATTENDEE_COLS).order_by(
+    WebinarRegistrants.created_at.desc(), WebinarRegistrants.id.desc()
+)
+_ATTENDEE_PROJECTION = _projection(_ATTENDEE_COLS)
+
+# Totals for the list views, counted in the database in one query
+_COUNT_STMT = select(
+    func.count(WebinarRegistrants.id),
+    func.count(distinct(WebinarRegistrants.webinar_title))
+)
+
+# Default page size for the registrant list views
+DEFAULT_PAGE_SIZE = 100
+
+
+@lru_cache(maxsize=4)
+def get_s3_client(access_key: str, secret_key: str, endpoint_url: str, region: str):
+    """Return a cached S3 client for the given credentials and endpoint (shared app-wide)"""
+    with _S3_SESSION_LOCK:
+        return _S3_SESSION.client(
+            's3',
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            endpoint_url=endpoint_url,
+            region_name=region,
+            config=_S3_CONFIG
+        )
+
+
+@lru_cache(maxsize=1)
+def _s3_config() -> Optional[SimpleNamespace]:
+    """Read the Object Storage settings from the environment once; None if credentials are missing"""
+    access_key = os.getenv("S3_ACCESS_KEY")
+    secret_key = os.getenv("S3_SECRET_KEY")
+    bucket = os.getenv("S3_BUCKET")
+    if not all([access_key, secret_key, bucket]):
+        return None
+    
+    return SimpleNamespace(
+        access_key=access_key,
+        secret_key=secret_key,
+        bucket=bucket,
+        endpoint_url=os.getenv("S3_ENDPOINT_URL", "https://objstorage.leapcell.io"),
+        region=os.getenv("S3_REGION", "us-east-1"),
+        cdn_base_url=os.getenv("S3_CDN_URL")
+    )
+
+
+def _s3_client(s3):
+    """Return the cached S3 client for an _s3_config() result"""
+    return get_s3_client(s3.access_key, s3.secret_key, s3.endpoint_url, s3.region)
+
+
+def _photo_extension(filename: Optional[str]) -> str:
+    """Return the uploaded file's extension (with the dot), or '.jpg' if it has no usable one"""
+    _, dot, ext = (filename or '').rpartition('.')
+    return f'.{ext}' if dot and 0 < len(ext) <= 5 and ext.isalnum() else '.jpg'
+
+
+@lru_cache(maxsize=1)
+def _settings():
+    """Application settings, validated once per process"""
+    from dependencies.config import get_settings
+    return get_settings()
+
+
+# Chunk size used when copying an uploaded stream to disk
+_COPY_CHUNK_SIZE = 1 << 20
+
+
+def _save_stream(path: Path, stream: BinaryIO) -> None:
+    """Copy a stream to a new file in chunks, creating its directory on first use (blocking, run in a worker thread)"""
+    try:
+        f = open(path, "wb")
+    except FileNotFoundError:
+        # Only stat/create the directory when it is actually missing
+        path.parent.mkdir(parents=True, exist_ok=True)
+        f = open(path, "wb")
+    with f:
+        shutil.copyfileobj(stream, f, _COPY_CHUNK_SIZE)
+
+
 class WebinarService:
     """Service for webinar registrant operations"""
     
     @staticmethod
-    def get_all_registrants():
-        """Get all webinar registrants with their photos"""
+    def _fetch_projection(stmt, projection, sort_column, limit: int, after: Optional[str]) -> tuple[list[dict], Optional[str]]:
+        """
+        Run one page of a prebuilt list query as plain rows (no ORM objects) and build JSON-ready dicts
+        
+        `stmt` must be ordered newest first by (sort_column, id); pages are fetched
+        by keyset, so later pages never scan past the rows already returned.
+        
+        Returns:
+            tuple: (rows, next_cursor) where next_cursor is None on the last page
+        
+        Raises:
+            ValueError: if `after` is not a cursor returned by a previous call
+        """
+        stmt = stmt.limit(limit)
+        if after:
+            sort_value, _, last_id = after.rpartition(",")
+            stmt = stmt.where(
+                tuple_(sort_column, WebinarRegistrants.id)
+                < tuple_(datetime.fromisoformat(sort_value), UUID(last_id))
+            )
+        
         with SessionLocal() as session:
-            result = session.execute(select(WebinarRegistrants))
-            registrants = result.scalars().all()
-            
-            return [
-                {
-                    "id": str(registrant.id),
-                    "name": registrant.name,
-                    "email": registrant.email,
-                    "company": registrant.company,
-                    "webinar_title": registrant.webinar_title,
-                    "webinar_date": registrant.webinar_date.isoformat(),
-                    "status": registrant.status,
-                    "photo_url": registrant.photo_url,
-                    "notes": registrant.notes,
-                    "registration_date": registrant.registration_date.isoformat()
-                }
-                for registrant in registrants
-            ]
+            rows = session.execute(stmt).all()
+        
+        next_cursor = None
+        if len(rows) == limit:
+            last = rows[-1]._mapping
+            next_cursor = f"{last[sort_column.key].isoformat()},{last['id']}"
+        
+        # Rows are already tuples in column order, so each dict is built by zip in C;
+        # only the id/datetime positions are rewritten in Python
+        keys, converters = projection
+        items = []
+        for row in rows:
+            if converters:
+                row = list(row)
+                for position, convert in converters:
+                    row[position] = convert(row[position])
+            items.append(dict(zip(keys, row)))
+        return items, next_cursor
+    
+    @staticmethod
+    async def get_all_registrants(limit: int = DEFAULT_PAGE_SIZE, after: Optional[str] = None) -> tuple[list[dict], Optional[str]]:
+        """Get one page of webinar registrants with their photos, newest registration first"""
+        return await asyncio.to_thread(
+            WebinarService._fetch_projection,
+            _REGISTRANT_LIST_STMT, _REGISTRANT_PROJECTION,
+            WebinarRegistrants.registration_date, limit, after
+        )
+    
+    @staticmethod
+    async def get_webinar_attendees(limit: int = DEFAULT_PAGE_SIZE, after: Optional[str] = None) -> tuple[list[dict], Optional[str]]:
+        """Get one page of webinar attendees for the marketing demo page, newest first"""
+        return await asyncio.to_thread(
+            WebinarService._fetch_projection,
+            _ATTENDEE_LIST_STMT, _ATTENDEE_PROJECTION,
+            WebinarRegistrants.created_at, limit, after
+        )
     
     @staticmethod
-    def get_webinar_attendees():
-        """Get webinar attendees for the marketing demo page"""
+    def _fetch_counts() -> tuple[int, int]:
+        """Count registrants and distinct webinars (blocking, run in a worker thread)"""
         with SessionLocal() as session:
-            result = session.execute(select(WebinarRegistrants))
-            registrants = result.scalars().all()
-            
-            return [
-                {
-                    "id": str(registrant.id),
-                    "name": registrant.name,
-                    "email": registrant.email,
-                    "company": registrant.company,
-                    "webinar_title": registrant.webinar_title,
-                    "webinar_date": registrant.webinar_date.isoformat(),
-                    "status": registrant.status,
-                    "group": registrant.group,
-                    "notes": registrant.notes,
-                    "photo_url": registrant.photo_url,
-                    "created_at": registrant.created_at.isoformat()
-                }
-                for registrant in registrants
-            ]
+            registrants, webinars = session.execute(_COUNT_STMT).one()
+        return registrants, webinars
     
     @staticmethod
-    def upload_photo(registrant_id: str, photo_content: bytes, filename: str) -> tuple[bool, str, Optional[str]]:
+    async def get_registrant_counts() -> tuple[int, int]:
+        """Get (total registrants, distinct webinars) without loading any rows"""
+        return await asyncio.to_thread(WebinarService._fetch_counts)
+    
+    @staticmethod
+    def direct_upload_enabled() -> bool:
+        """True when the browser should upload photos straight to Object Storage (presign + confirm)"""
+        return _settings().environment != "development" and _s3_config() is not None
+    
+    @staticmethod
+    async def upload_photo(
+        registrant_id: UUID,
+        photo_stream: BinaryIO,
+        filename: str,
+        content_type: Optional[str] = None
+    ) -> tuple[bool, str, Optional[str]]:
         """
         Upload a photo for a webinar registrant
         
+        The photo is read from `photo_stream` in chunks, so the caller never has
+        to buffer the whole file in memory.
+        
         Environment-based storage:
         - development: Local file storage (/static/uploads)
         - production: Object storage (S3/CDN)
@@ -74,60 +294,41 @@ class WebinarService:
             tuple: (success, message, photo_url)
         """
         try:
-            from dependencies.config import get_settings
-            from pathlib import Path
-            
-            settings = get_settings()
+            settings = _settings()
             
             # Check environment to determine storage method
             if settings.environment == "development":
-                return WebinarService._upload_photo_local(registrant_id, photo_content, filename, settings)
+                return await WebinarService._upload_photo_local(registrant_id, photo_stream, filename, settings)
             else:
-                return WebinarService._upload_photo_s3(registrant_id, photo_content, filename, settings)
+                # boto3 is blocking; keep the upload off the event loop
+                return await asyncio.to_thread(
+                    WebinarService._upload_photo_s3, registrant_id, photo_stream, filename, content_type
+                )
                 
         except Exception as e:
             return False, f"Failed to upload photo: {str(e)}", None
     
     @staticmethod
-    def _upload_photo_local(registrant_id: str, photo_content: bytes, filename: str, settings) -> tuple[bool, str, Optional[str]]:
+    async def _upload_photo_local(registrant_id: UUID, photo_stream: BinaryIO, filename: str, settings) -> tuple[bool, str, Optional[str]]:
         """Upload photo to local file system (development)"""
         try:
-            from uuid import UUID
-            from sqlmodel import select
-            
             # Generate unique filename
-            file_extension = Path(filename).suffix if filename else '.jpg'
-            unique_filename = f"{uuid.uuid4()}{file_extension}"
-            
-            # Save to local file system
-            upload_dir = Path(settings.upload_dir)
-            photos_dir = upload_dir / "photos"
-            photos_dir.mkdir(parents=True, exist_ok=True)
+            file_extension = _photo_extension(filename)
+            unique_filename = token_hex(16) + file_extension
             
-            local_path = photos_dir / unique_filename
-            with open(local_path, "wb") as f:
-                f.write(photo_content)
+            # Save to local file system without blocking the event loop
+            local_path = Path(settings.upload_dir) / "photos" / unique_filename
+            await asyncio.to_thread(_save_stream, local_path, photo_stream)
             
             # Generate local URL
             photo_url = f"/static/uploads/photos/{unique_filename}"
             
             # Update database
-            try:
-                registrant_uuid = UUID(registrant_id)
-            except ValueError:
-                return False, "Invalid registrant ID", None
-            
-            with SessionLocal() as session:
-                result = session.execute(
-                    select(WebinarRegistrants).where(WebinarRegistrants.id == registrant_uuid)
-                )
-                registrant = result.scalar_one_or_none()
-                
-                if not registrant:
-                    return False, "Registrant not found", None
-                
-                registrant.photo_url = photo_url
-                session.commit()
+            updated = await asyncio.to_thread(
+                WebinarService._update_registrant, registrant_id, photo_url=photo_url
+            )
+            if not updated:
+                return False, "Registrant not found", None
             
             return True, "Photo uploaded successfully to local storage!", photo_url
             
@@ -135,74 +336,43 @@ class WebinarService:
             return False, f"Local upload failed: {str(e)}", None
     
     @staticmethod
-    def _upload_photo_s3(registrant_id: str, photo_content: bytes, filename: str, settings) -> tuple[bool, str, Optional[str]]:
+    def _upload_photo_s3(
+        registrant_id: UUID,
+        photo_stream: BinaryIO,
+        filename: str,
+        content_type: Optional[str]
+    ) -> tuple[bool, str, Optional[str]]:
         """Upload photo to object storage (production)"""
         try:
-            import boto3
             from botocore.exceptions import ClientError
-            from uuid import UUID
-            from sqlmodel import select
             
             # Check S3 credentials
-            s3_access_key = os.getenv("S3_ACCESS_KEY")
-            s3_secret_key = os.getenv("S3_SECRET_KEY")
-            s3_bucket = os.getenv("S3_BUCKET")
-            s3_endpoint_url = os.getenv("S3_ENDPOINT_URL", "https://objstorage.leapcell.io")
-            s3_region = os.getenv("S3_REGION", "us-east-1")
-            
-            if not all([s3_access_key, s3_secret_key, s3_bucket]):
+            s3 = _s3_config()
+            if s3 is None:
                 return False, "S3 credentials not configured", None
             
             # Generate unique filename
-            file_extension = Path(filename).suffix if filename else '.jpg'
-            unique_filename = f"{uuid.uuid4()}{file_extension}"
-            
-            # Initialize S3 client
-            s3_client = boto3.client(
-                's3',
-                aws_access_key_id=s3_access_key,
-                aws_secret_access_key=s3_secret_key,
-                endpoint_url=s3_endpoint_url,
-                region_name=s3_region
-            )
+            file_extension = _photo_extension(filename)
+            unique_filename = token_hex(16) + file_extension
+            
+            # Reuse the cached S3 client (and its connection pool)
+            s3_client = _s3_client(s3)
             
             # Upload to Object Storage
             s3_key = f"photos/{unique_filename}"
-            s3_client.put_object(
-                Bucket=s3_bucket,
-                Key=s3_key,
-                Body=photo_content,
-                ContentType='image/jpeg'
+            content_type = content_type or mimetypes.guess_type(unique_filename)[0] or 'image/jpeg'
+            s3_client.upload_fileobj(
+                photo_stream,
+                s3.bucket,
+                s3_key,
+                ExtraArgs={'ContentType': content_type},
+                Config=_TRANSFER_CFG
             )
             
-            # Generate CDN URL using the user's S3 bucket
-            # For LeapCell, the CDN URL format is: https://{account_id}.leapcellobj.com/{bucket}/{key}
-            # Try to get CDN URL from environment variable, otherwise construct it
-            cdn_base_url = os.getenv("S3_CDN_URL")
-            if cdn_base_url:
-                # CDN base URL already includes the bucket, just append the key
-                photo_url = f"{cdn_base_url}/{s3_key}"
-            else:
-                # Fallback: use the S3 endpoint URL (may not work for CDN)
-                photo_url = f"{s3_endpoint_url}/{s3_bucket}/{s3_key}"
-            
-            # Convert string to UUID
-            try:
-                registrant_uuid = UUID(registrant_id)
-            except ValueError:
-                return False, "Invalid registrant ID", None
+            photo_url = WebinarService._photo_url_for_key(s3_key, s3)
             
-            with SessionLocal() as session:
-                result = session.execute(
-                    select(WebinarRegistrants).where(WebinarRegistrants.id == registrant_uuid)
-                )
-                registrant = result.scalar_one_or_none()
-                
-                if not registrant:
-                    return False, "Registrant not found", None
-                
-                registrant.photo_url = photo_url
-                session.commit()
+            if not WebinarService._update_registrant(registrant_id, photo_url=photo_url):
+                return False, "Registrant not found", None
             
             return True, "Photo uploaded successfully to Object Storage!", photo_url
             
@@ -212,32 +382,160 @@ class WebinarService:
             return False, f"Failed to upload photo: {str(e)}", None
     
     @staticmethod
-    def update_notes(registrant_id: str, notes: str) -> tuple[bool, str]:
+    def _photo_url_for_key(s3_key: str, s3: SimpleNamespace) -> str:
+        """Build the public URL for an object in the photos bucket"""
+        # Generate CDN URL using the user's S3 bucket
+        # For LeapCell, the CDN URL format is: https://{account_id}.leapcellobj.com/{bucket}/{key}
+        # Use the CDN URL from the environment if set, otherwise construct it
+        if s3.cdn_base_url:
+            # CDN base URL already includes the bucket, just append the key
+            return f"{s3.cdn_base_url}/{s3_key}"
+        # Fallback: use the S3 endpoint URL (may not work for CDN)
+        return f"{s3.endpoint_url}/{s3.bucket}/{s3_key}"
+    
+    @staticmethod
+    async def create_presigned_upload(registrant_id: UUID, filename: str) -> tuple[bool, str, Optional[dict]]:
         """
-        Update notes for a webinar registrant
+        Create a presigned POST so the browser uploads a photo straight to Object Storage
+        
+        The client posts the file to `url` with `fields`, then calls confirm_photo
+        with the returned `key` to attach it to the registrant.
         
         Returns:
-            tuple: (success, message)
+            tuple: (success, message, {url, fields, key})
         """
         try:
-            # Convert string to UUID
+            # Check S3 credentials
+            s3 = _s3_config()
+            if s3 is None:
+                return False, "S3 credentials not configured", None
+            
+            # Generate unique object key
+            file_extension = _photo_extension(filename)
+            s3_key = f"photos/{token_hex(16)}{file_extension}"
+            content_type = mimetypes.guess_type(s3_key)[0] or 'image/jpeg'
+            
+            # The first call builds the client (loading botocore models from disk),
+            # so the whole presign runs in a worker thread
+            presigned = await asyncio.to_thread(WebinarService._presign_post, s3, s3_key, content_type)
+            
+            return True, "Presigned upload created", {
+                "url": presigned["url"],
+                "fields": presigned["fields"],
+                "key": s3_key
+            }
+            
+        except Exception as e:
+            return False, f"Failed to create presigned upload: {str(e)}", None
+    
+    @staticmethod
+    def _presign_post(s3: SimpleNamespace, s3_key: str, content_type: str) -> dict:
+        """Sign a POST policy for one photo upload (blocking, run in a worker thread)"""
+        return _s3_client(s3).generate_presigned_post(
+            Bucket=s3.bucket,
+            Key=s3_key,
+            Fields={"Content-Type": content_type},
+            Conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", 1, _MAX_PHOTO_BYTES]
+            ],
+            ExpiresIn=_PRESIGNED_EXPIRY
+        )
+    
+    @staticmethod
+    def _head_photo(s3: SimpleNamespace, s3_key: str) -> dict:
+        """HEAD one uploaded photo (blocking, run in a worker thread)"""
+        return _s3_client(s3).head_object(Bucket=s3.bucket, Key=s3_key)
+    
+    @staticmethod
+    async def confirm_photo(registrant_id: UUID, s3_key: str) -> tuple[bool, str, Optional[str]]:
+        """
+        Attach a photo uploaded through a presigned POST to a webinar registrant
+        
+        Returns:
+            tuple: (success, message, photo_url)
+        """
+        try:
+            from botocore.exceptions import ClientError
+            
+            # Only keys handed out by create_presigned_upload are accepted
+            if not s3_key.startswith("photos/") or "/" in s3_key[len("photos/"):]:
+                return False, "Invalid photo key", None
+            
+            # Check S3 credentials
+            s3 = _s3_config()
+            if s3 is None:
+                return False, "S3 credentials not configured", None
+            
+            # Make sure the upload actually landed and respects the size limit
             try:
-                registrant_uuid = UUID(registrant_id)
-            except ValueError:
-                return False, "Invalid registrant ID"
+                head = await asyncio.to_thread(WebinarService._head_photo, s3, s3_key)
+            except ClientError:
+                return False, "Uploaded photo not found", None
+            
+            if head["ContentLength"] > _MAX_PHOTO_BYTES:
+                return False, "File size must be less than 5MB", None
+            
+            photo_url = WebinarService._photo_url_for_key(s3_key, s3)
+            
+            updated = await asyncio.to_thread(
+                WebinarService._update_registrant, registrant_id, photo_url=photo_url
+            )
+            if not updated:
+                return False, "Registrant not found", None
+            
+            return True, "Photo uploaded successfully to Object Storage!", photo_url
+            
+        except Exception as e:
+            return False, f"Failed to confirm photo: {str(e)}", None
+    
+    @staticmethod
+    def _update_registrant(registrant_uuid: UUID, **values) -> bool:
+        """Set columns on one registrant with a single UPDATE ... RETURNING; False if not found"""
+        with SessionLocal() as session, session.begin():
+            result = session.execute(
+                update(WebinarRegistrants)
+                .where(WebinarRegistrants.id == registrant_uuid)
+                .values(**values)
+                .returning(WebinarRegistrants.id)
+            )
+            return result.first() is not None
+    
+    @staticmethod
+    def _clear_photo_url(registrant_uuid: UUID) -> tuple[bool, Optional[str]]:
+        """Clear a registrant's photo_url; returns (found, previous photo_url)"""
+        with SessionLocal() as session, session.begin():
+            # Read only the photo column, then clear it in the same transaction
+            row = session.execute(
+                select(WebinarRegistrants.photo_url).where(WebinarRegistrants.id == registrant_uuid)
+            ).first()
+            
+            if row is None:
+                return False, None
             
-            with SessionLocal() as session:
-                result = session.execute(
-                    select(WebinarRegistrants).where(WebinarRegistrants.id == registrant_uuid)
+            if row.photo_url:
+                session.execute(
+                    update(WebinarRegistrants)
+                    .where(WebinarRegistrants.id == registrant_uuid)
+                    .values(photo_url=None)
                 )
-                registrant = result.scalar_one_or_none()
-                
-                if not registrant:
-                    return False, "Registrant not found"
-                
-                # Update database
-                registrant.notes = notes
-                session.commit()
+            return True, row.photo_url
+    
+    @staticmethod
+    async def update_notes(registrant_id: UUID, notes: str) -> tuple[bool, str]:
+        """
+        Update notes for a webinar registrant
+        
+        Returns:
+            tuple: (success, message)
+        """
+        try:
+            # Update database
+            updated = await asyncio.to_thread(
+                WebinarService._update_registrant, registrant_id, notes=notes
+            )
+            if not updated:
+                return False, "Registrant not found"
             
             return True, "Notes updated successfully!"
             
@@ -245,46 +543,41 @@ class WebinarService:
             return False, f"Error updating notes: {str(e)}"
     
     @staticmethod
-    def delete_photo(registrant_id: str) -> tuple[bool, str]:
+    async def delete_photo(registrant_id: UUID) -> tuple[bool, str, Optional[Path]]:
         """
         Delete a photo for a webinar registrant
         
+        Only the database row is updated here; the caller removes the local file
+        (if any) with remove_photo_file, e.g. as a background task after responding.
+        
         Returns:
-            tuple: (success, message)
+            tuple: (success, message, photo_path) where photo_path is the local file to remove
         """
         try:
-            # Convert string to UUID
-            try:
-                registrant_uuid = UUID(registrant_id)
-            except ValueError:
-                return False, "Invalid registrant ID"
+            # Update database
+            found, photo_url = await asyncio.to_thread(WebinarService._clear_photo_url, registrant_id)
             
-            with SessionLocal() as session:
-                result = session.execute(
-                    select(WebinarRegistrants).where(WebinarRegistrants.id == registrant_uuid)
-                )
-                registrant = result.scalar_one_or_none()
-                
-                if not registrant:
-                    return False, "Registrant not found"
-                
-                if not registrant.photo_url:
-                    return False, "No photo found for this registrant"
-                
-                # Delete file from filesystem
-                photo_path = Path("static") / registrant.photo_url.lstrip("/static/")
-                try:
-                    if photo_path.exists():
-                        photo_path.unlink()
-                except Exception as e:
-                    # Log error but don't fail the request
-                    print(f"Failed to delete file {photo_path}: {e}")
-                
-                # Update database
-                registrant.photo_url = None
-                session.commit()
+            if not found:
+                return False, "Registrant not found", None
+            
+            if not photo_url:
+                return False, "No photo found for this registrant", None
+            
+            # Object Storage URLs have no local file to remove
+            photo_path = None
+            if photo_url.startswith("/static/"):
+                photo_path = _STATIC_ROOT / photo_url.removeprefix("/static/")
             
-            return True, "Photo deleted successfully!"
+            return True, "Photo deleted successfully!", photo_path
             
         except Exception as e:
-            return False, f"Error deleting photo: {str(e)}" 
\ No newline at end of file
+            return False, f"Error deleting photo: {str(e)}", None
+    
+    @staticmethod
+    def remove_photo_file(photo_path: Path) -> None:
+        """Delete a photo file from local storage if it exists (blocking, logs failures)"""
+        try:
+            photo_path.unlink(missing_ok=True)
+        except Exception as e:
+            # Log error; the database row is already cleared
+            print(f"Failed to delete file {photo_path}: {e}") 
\ No newline at end of file
@@ -0,0 +1,49 @@
+"""
+Tests for the shared default-superuser insert.
+"""
+
+import pytest
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, select
+
+import auth.core as auth_core
+from models import User
+
+
+@pytest.fixture
+def session():
+    """A session on a fresh in-memory SQLite database."""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine)
+    with sessionmaker(bind=engine, expire_on_commit=False)() as session:
+        yield session
+    engine.dispose()
+
+
+def count_admins(session) -> int:
+    return session.execute(
+        select(func.count()).select_from(User).where(User.email == "admin@example.com")
+    ).scalar_one()
+
+
+class TestInsertSuperuser:
+    """Test that creating the default superuser is idempotent."""
+
+    def test_on_conflict_insert_is_idempotent(self, session):
+        """The first call creates the user; later calls leave it alone."""
+        assert auth_core.insert_superuser(session, is_staff=True) is True
+        assert auth_core.insert_superuser(session, is_staff=True) is False
+        assert count_admins(session) == 1
+
+        user = session.execute(select(User).where(User.email == "admin@example.com")).scalar_one()
+        assert user.is_superuser and user.is_staff and user.is_active
+
+    def test_unknown_dialect_falls_back_to_select_then_insert(self, session, monkeypatch):
+        """Backends without a known ON CONFLICT insert still work."""
+        monkeypatch.setattr(auth_core, "_DIALECT_INSERTS", {})
+
+        assert auth_core.insert_superuser(session) is True
+        assert auth_core.insert_superuser(session) is False
+        assert count_admins(session) == 1
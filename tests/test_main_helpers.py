@@ -0,0 +1,168 @@
+"""
+Unit tests for small helper functions in main.py.
+"""
+
+import io
+import time
+import uuid
+from email.utils import formatdate
+
+import pytest
+from starlette.requests import Request
+
+from main import _copy_then_commit, _is_not_modified, _new_uuids, _save_transient_body
+
+
+def make_request(**headers) -> Request:
+    """Build a bare GET request carrying the given headers."""
+    raw_headers = [
+        (name.replace("_", "-").lower().encode(), value.encode())
+        for name, value in headers.items()
+    ]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw_headers})
+
+
+class TestIsNotModified:
+    """Test conditional-GET validation for served images."""
+
+    etag = '"abc-123"'
+    mtime = 1_700_000_000.5
+
+    def test_no_validators(self):
+        """Without conditional headers the file is always sent."""
+        assert _is_not_modified(make_request(), self.etag, self.mtime) is False
+
+    @pytest.mark.parametrize("header", ['"abc-123"', '"x", "abc-123"', ' "abc-123" ', "*"])
+    def test_if_none_match_hit(self, header):
+        """A matching tag (in a list, padded, or *) means not modified."""
+        request = make_request(if_none_match=header)
+        assert _is_not_modified(request, self.etag, self.mtime) is True
+
+    def test_if_none_match_miss(self):
+        """A different tag means the file changed."""
+        request = make_request(if_none_match='"other"')
+        assert _is_not_modified(request, self.etag, self.mtime) is False
+
+    def test_if_none_match_takes_precedence(self):
+        """If-Modified-Since is ignored when If-None-Match is present."""
+        request = make_request(
+            if_none_match='"other"',
+            if_modified_since=formatdate(self.mtime + 60, usegmt=True),
+        )
+        assert _is_not_modified(request, self.etag, self.mtime) is False
+
+    @pytest.mark.parametrize("offset, expected", [(0, True), (60, True), (-60, False)])
+    def test_if_modified_since(self, offset, expected):
+        """Dates at or after the (whole-second) mtime mean not modified."""
+        request = make_request(if_modified_since=formatdate(int(self.mtime) + offset, usegmt=True))
+        assert _is_not_modified(request, self.etag, self.mtime) is expected
+
+    def test_if_modified_since_naive_date_is_utc(self, monkeypatch):
+        """A "-0000" zone parses as naive and is still compared as GMT, not local time."""
+        # In a zone east of UTC a naive date read as local time looks older than the file
+        monkeypatch.setenv("TZ", "Asia/Tokyo")
+        time.tzset()
+        try:
+            header = formatdate(int(self.mtime), usegmt=True).replace("GMT", "-0000")
+            request = make_request(if_modified_since=header)
+            assert _is_not_modified(request, self.etag, self.mtime) is True
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+    def test_if_modified_since_garbage(self):
+        """An unparseable date is treated as modified."""
+        request = make_request(if_modified_since="yesterday-ish")
+        assert _is_not_modified(request, self.etag, self.mtime) is False
+
+
+class TestNewUuids:
+    """Test batch UUID generation for seeding."""
+
+    def test_count_and_version(self):
+        """Each value is a distinct RFC 4122 version-4 UUID."""
+        ids = _new_uuids(50)
+        assert len(ids) == 50
+        assert len(set(ids)) == 50
+        for value in ids:
+            assert isinstance(value, uuid.UUID)
+            assert value.version == 4
+            assert value.variant == uuid.RFC_4122
+
+    def test_zero(self):
+        """Asking for none returns an empty list."""
+        assert _new_uuids(0) == []
+
+
+class TestCopyThenCommit:
+    """Test that sample photo copies are rolled back with the DB write."""
+
+    def make_jobs(self, tmp_path, count=3):
+        """Create sample photos and (src, dst) jobs copying them into photos/."""
+        src_dir = tmp_path / "sample_photos"
+        dst_dir = tmp_path / "photos"
+        src_dir.mkdir()
+        dst_dir.mkdir()
+        jobs = []
+        for i in range(count):
+            src = src_dir / f"p{i}.jpg"
+            src.write_bytes(b"jpeg" * (i + 1))
+            jobs.append((src, dst_dir / f"copy_{i}.jpg"))
+        return jobs
+
+    def test_success_keeps_copies(self, tmp_path):
+        """Copies stay in place once the commit succeeds."""
+        jobs = self.make_jobs(tmp_path)
+        committed = []
+        _copy_then_commit(jobs, lambda: committed.append(True))
+        assert committed == [True]
+        for src, dst in jobs:
+            assert dst.read_bytes() == src.read_bytes()
+
+    def test_failed_commit_removes_copies(self, tmp_path):
+        """A failing commit removes every copied photo and re-raises."""
+        jobs = self.make_jobs(tmp_path)
+
+        def commit():
+            raise RuntimeError("db down")
+
+        with pytest.raises(RuntimeError, match="db down"):
+            _copy_then_commit(jobs, commit)
+        assert list((tmp_path / "photos").iterdir()) == []
+        assert all(src.exists() for src, _ in jobs)
+
+
+class FailingBody:
+    """A download body that returns some data and then raises."""
+
+    def __init__(self, data: bytes):
+        self.chunks = [data]
+
+    def read(self, size=-1):
+        if self.chunks:
+            return self.chunks.pop()
+        raise ConnectionResetError("connection dropped")
+
+
+class TestSaveTransientBody:
+    """Test writing one-shot S3 downloads to disk."""
+
+    def test_writes_body(self, tmp_path):
+        """The whole body lands on disk when the size matches."""
+        path = tmp_path / "photo.jpg"
+        data = b"x" * 5000
+        _save_transient_body(io.BytesIO(data), path, len(data))
+        assert path.read_bytes() == data
+
+    def test_short_body_is_truncated(self, tmp_path):
+        """A body shorter than the advertised size leaves no preallocated padding."""
+        path = tmp_path / "photo.jpg"
+        _save_transient_body(io.BytesIO(b"short"), path, 4096)
+        assert path.read_bytes() == b"short"
+
+    def test_failed_download_removes_partial_file(self, tmp_path):
+        """A download that fails part-way is unlinked and the error re-raised."""
+        path = tmp_path / "photo.jpg"
+        with pytest.raises(ConnectionResetError):
+            _save_transient_body(FailingBody(b"partial"), path, 4096)
+        assert not path.exists()
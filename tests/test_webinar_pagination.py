@@ -0,0 +1,130 @@
+"""
+Keyset pagination tests for the webinar registrant list endpoints.
+
+Runs the real list queries against an in-memory SQLite database, including
+rows that share a sort timestamp so the id tie-break is exercised.
+"""
+
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+
+import services.webinar_service as webinar_service
+from models import WebinarRegistrants
+from routes.api import router as api_router
+from services.webinar_service import WebinarService
+
+
+@pytest.fixture
+def registrants(monkeypatch):
+    """Seed 7 registrants (dates tied in groups of 3) and point the service at them."""
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    SQLModel.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+
+    with session_factory() as session:
+        for i in range(7):
+            day = datetime(2024, 1, 1 + i // 3)
+            session.add(WebinarRegistrants(
+                name=f"Registrant {i}",
+                email=f"r{i}@example.com",
+                webinar_title="FastAPI",
+                webinar_date=day,
+                registration_date=day,
+                created_at=day,
+            ))
+        session.commit()
+        rows = session.query(WebinarRegistrants).all()
+        expected = [
+            str(r.id) for r in sorted(rows, key=lambda r: (r.registration_date, r.id), reverse=True)
+        ]
+
+    monkeypatch.setattr(webinar_service, "SessionLocal", session_factory)
+    yield expected
+    engine.dispose()
+
+
+class TestKeysetPagination:
+    """Test cursor paging over the registrant list queries."""
+
+    @pytest.mark.parametrize("limit", [1, 2, 3, 7, 10])
+    async def test_pages_cover_every_row_once_in_order(self, registrants, limit):
+        """Walking next_cursor returns every row exactly once, newest first, ties broken by id."""
+        seen, after, pages = [], None, 0
+        while True:
+            page, after = await WebinarService.get_all_registrants(limit, after)
+            assert len(page) <= limit
+            seen += [r["id"] for r in page]
+            pages += 1
+            if after is None:
+                break
+            assert pages < 20
+
+        assert seen == registrants
+
+    async def test_attendee_pages_match_registrant_order(self, registrants):
+        """The attendee view pages by created_at the same way."""
+        seen, after = [], None
+        while True:
+            page, after = await WebinarService.get_webinar_attendees(2, after)
+            seen += [r["id"] for r in page]
+            if after is None:
+                break
+
+        assert seen == registrants
+
+    async def test_full_last_page_ends_with_empty_page(self, registrants):
+        """A last page that is exactly `limit` long is followed by an empty page with no cursor."""
+        page, after = await WebinarService.get_all_registrants(7)
+        assert len(page) == 7 and after is not None
+
+        page, after = await WebinarService.get_all_registrants(7, after)
+        assert page == [] and after is None
+
+    async def test_rows_are_json_ready(self, registrants):
+        """UUID and datetime columns come back as strings."""
+        page, _ = await WebinarService.get_all_registrants(1)
+        row = page[0]
+        assert row["id"] == registrants[0]
+        assert row["registration_date"] == "2024-01-03T00:00:00"
+        assert set(row) == {c.key for c in webinar_service._REGISTRANT_COLS}
+
+    @pytest.mark.parametrize("cursor", ["bogus", ",", "2024-01-01T00:00:00,not-a-uuid"])
+    async def test_bad_cursor_raises_value_error(self, registrants, cursor):
+        """Cursors that were not produced by the service are rejected."""
+        with pytest.raises(ValueError):
+            await WebinarService.get_all_registrants(2, cursor)
+
+    def test_bad_cursor_returns_400(self, registrants):
+        """The API turns a bad cursor into a 400 instead of a server error."""
+        app = FastAPI()
+        app.include_router(api_router, prefix="/api")
+        with TestClient(app) as client:
+            response = client.get("/api/webinar-attendees", params={"after": "bogus"})
+            assert response.status_code == 400
+            assert response.json() == {"error": "Invalid cursor"}
+
+            response = client.get("/api/webinar-attendees", params={"limit": 3})
+            assert response.status_code == 200
+            assert response.json()["next_cursor"] is not None
+
+    async def test_counts_cover_every_row(self, registrants):
+        """The counters count all rows and distinct webinar titles without paging."""
+        assert await WebinarService.get_registrant_counts() == (7, 1)
+
+        app = FastAPI()
+        app.include_router(api_router, prefix="/api")
+        with TestClient(app) as client:
+            response = client.get("/api/webinar-attendees/count")
+            assert response.status_code == 200
+            assert response.json() == {"attendees": 7, "webinars": 1}
@@ -0,0 +1,28 @@
+"""
+Unit tests for webinar service helpers.
+"""
+
+import pytest
+
+from services.webinar_service import _photo_extension
+
+
+class TestPhotoExtension:
+    """Test extension handling for uploaded photo filenames."""
+
+    @pytest.mark.parametrize("filename, expected", [
+        ("me.png", ".png"),
+        ("Holiday.JPEG", ".JPEG"),
+        ("archive.tar.gz", ".gz"),
+        ("photo.webp", ".webp"),
+    ])
+    def test_keeps_short_alphanumeric_extension(self, filename, expected):
+        """The last dotted segment is kept as-is."""
+        assert _photo_extension(filename) == expected
+
+    @pytest.mark.parametrize("filename", [
+        None, "", "noext", "trailing.", "a.verylong", "a.b/c", "a.p g", "../x.j\\p",
+    ])
+    def test_falls_back_to_jpg(self, filename):
+        """Missing, empty, long or unsafe extensions become .jpg."""
+        assert _photo_extension(filename) == ".jpg"